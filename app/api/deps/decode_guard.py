@@ -283,7 +283,7 @@ class DecodeAuthGuard:
                 ttl_seconds = max(1, int((exp_dt - now).total_seconds()))
 
                 # Rotate Redis key: delete old, set new
-                new_session_id = str(uuid.uuid4())[:8]
+                new_session_id = uuid.uuid4().hex[:8]
                 new_key = f"deid_session_id:{new_session_id}"
                 old_key = f"deid_session_id:{old_session_id}"
 
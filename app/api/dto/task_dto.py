@@ -86,9 +86,9 @@ class TaskListResponseDTO(BaseModel):
     success: bool = Field(..., description="Operation success status")
     message: str = Field(..., description="Response message")
     data: List[TaskResponseDTO] = Field(..., description="List of tasks")
-    pagination: Dict[str, int] = Field(
+    pagination: Dict[str, Any] = Field(
         ...,
-        description="Pagination metadata (page, page_size, total_count, total_pages)",
+        description="Pagination metadata (page, page_size, total_count, total_pages, next_cursor)",
     )
 
 
@@ -5,7 +5,10 @@ Handles task/badge management endpoints.
 
 from typing import List, Optional
 
+import orjson
+from bson import ObjectId
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from app.api.deps.decode_guard import (
     AuthenticatedUser,
@@ -28,6 +31,13 @@ logger = get_logger(__name__)
 # Create router
 router = APIRouter()
 
+# User-friendly filter values accepted by the list/stream endpoints
+_TYPE_FILTER_MAPPING = {
+    "token": "erc20_balance_check",
+    "nft": "erc721_balance_check",
+}
+_ALLOWED_NETWORK_FILTERS = ("ethereum", "bsc", "base")
+
 
 @router.post("/create", response_model=TaskCreateResponseDTO)
 async def create_task(
@@ -82,6 +92,15 @@ async def create_task(
 async def get_tasks(
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+    after: Optional[str] = Query(
+        None,
+        description="Opaque cursor: id of the last task from the previous page. "
+        "Preferred over page for deep pagination.",
+    ),
+    include_total: bool = Query(
+        False,
+        description="Also compute total_count/total_pages (extra count query)",
+    ),
     type: Optional[List[str]] = Query(
         None,
         description="Filter by task types (can select multiple): 'token' (ERC20), 'nft' (ERC721)",
@@ -95,8 +114,10 @@ async def get_tasks(
     Get paginated list of tasks with optional filters.
 
     Args:
-        page: Page number (1-indexed, default: 1)
+        page: Page number (1-indexed, default: 1, ignored when after is set)
         page_size: Number of items per page (default: 10, max: 100)
+        after: Optional cursor (id of the last task from the previous page)
+        include_total: Also compute total_count/total_pages (extra count query)
         type: Optional filter by task types (can pass multiple: type=token&type=nft)
         network: Optional filter by blockchain networks (can pass multiple: network=ethereum&network=bsc)
 
@@ -110,16 +131,26 @@ async def get_tasks(
         - Ethereum and BSC: /api/v1/task/list?network=ethereum&network=bsc
         - Token tasks on Ethereum and Base: /api/v1/task/list?type=token&network=ethereum&network=base
     """
+    # A malformed cursor would otherwise surface as a 500 from ObjectId()
+    if after is not None and not ObjectId.is_valid(after):
+        return TaskListResponseDTO(
+            success=False,
+            message="Invalid 'after' cursor; expected the id of a previously returned task",
+            data=[],
+            pagination={
+                "page": page,
+                "page_size": page_size,
+                "total_count": 0,
+                "total_pages": 0,
+            },
+        )
+
     # Map user-friendly type filters to validation_types
     validation_types = None
     if type:
-        type_mapping = {
-            "token": "erc20_balance_check",
-            "nft": "erc721_balance_check",
-        }
         validation_types = []
         for t in type:
-            mapped_type = type_mapping.get(t.lower())
+            mapped_type = _TYPE_FILTER_MAPPING.get(t.lower())
             if not mapped_type:
                 return TaskListResponseDTO(
                     success=False,
@@ -137,13 +168,12 @@ async def get_tasks(
     # Validate network filters
     blockchain_networks = None
     if network:
-        allowed_networks = ["ethereum", "bsc", "base"]
         blockchain_networks = []
         for net in network:
-            if net.lower() not in allowed_networks:
+            if net.lower() not in _ALLOWED_NETWORK_FILTERS:
                 return TaskListResponseDTO(
                     success=False,
-                    message=f"Invalid network filter '{net}'. Allowed values: {', '.join(allowed_networks)}",
+                    message=f"Invalid network filter '{net}'. Allowed values: {', '.join(_ALLOWED_NETWORK_FILTERS)}",
                     data=[],
                     pagination={
                         "page": page,
@@ -159,26 +189,35 @@ async def get_tasks(
     )
 
     try:
-        tasks, total_count, total_pages = await task_service.get_tasks_paginated(
-            page=page,
-            page_size=page_size,
-            validation_types=validation_types,
-            blockchain_networks=blockchain_networks,
+        tasks, total_count, total_pages, next_cursor, has_next = (
+            await task_service.get_tasks_paginated(
+                page=page,
+                page_size=page_size,
+                validation_types=validation_types,
+                blockchain_networks=blockchain_networks,
+                after=after,
+                include_total=include_total,
+            )
         )
 
         # Convert tasks to response DTOs
         task_responses = [TaskResponseDTO(**task) for task in tasks]
 
+        pagination = {
+            "page": page,
+            "page_size": page_size,
+            "has_next": has_next,
+            "next_cursor": next_cursor,
+        }
+        if include_total:
+            pagination["total_count"] = total_count
+            pagination["total_pages"] = total_pages
+
         return TaskListResponseDTO(
             success=True,
             message="Tasks retrieved successfully",
             data=task_responses,
-            pagination={
-                "page": page,
-                "page_size": page_size,
-                "total_count": total_count,
-                "total_pages": total_pages,
-            },
+            pagination=pagination,
         )
 
     except Exception as e:
@@ -196,6 +235,79 @@ async def get_tasks(
         )
 
 
+@router.get("/list/stream", include_in_schema=False)
+async def stream_tasks(
+    limit: int = Query(1000, ge=1, le=10000, description="Maximum rows to stream"),
+    after: Optional[str] = Query(
+        None, description="Opaque cursor: id of the last task already seen"
+    ),
+    type: Optional[List[str]] = Query(
+        None,
+        description="Filter by task types (can select multiple): 'token' (ERC20), 'nft' (ERC721)",
+    ),
+    network: Optional[List[str]] = Query(
+        None,
+        description="Filter by blockchain networks (can select multiple): 'ethereum', 'bsc', 'base'",
+    ),
+) -> StreamingResponse:
+    """
+    Stream tasks newest-first as newline-delimited JSON.
+
+    Rows are serialized and flushed as they come off the database cursor,
+    so large exports don't buffer the full result set in memory.
+
+    Args:
+        limit: Maximum number of rows to stream (default: 1000)
+        after: Optional cursor (id of the last task already seen)
+        type: Optional filter by task types (can pass multiple: type=token&type=nft)
+        network: Optional filter by blockchain networks (can pass multiple: network=ethereum&network=bsc)
+
+    Returns:
+        StreamingResponse with one JSON task per line
+    """
+    # Inputs are validated up front: once streaming starts the status line
+    # is already on the wire, so errors found later can't become a 422
+    if after is not None and not ObjectId.is_valid(after):
+        raise HTTPException(
+            status_code=422,
+            detail="Invalid 'after' cursor; expected the id of a previously returned task",
+        )
+
+    validation_types = None
+    if type:
+        validation_types = []
+        for t in type:
+            mapped_type = _TYPE_FILTER_MAPPING.get(t.lower())
+            if not mapped_type:
+                raise HTTPException(
+                    status_code=422,
+                    detail=f"Invalid type filter '{t}'. Allowed values: 'token', 'nft'",
+                )
+            validation_types.append(mapped_type)
+
+    blockchain_networks = None
+    if network:
+        blockchain_networks = []
+        for net in network:
+            if net.lower() not in _ALLOWED_NETWORK_FILTERS:
+                raise HTTPException(
+                    status_code=422,
+                    detail=f"Invalid network filter '{net}'. Allowed values: {', '.join(_ALLOWED_NETWORK_FILTERS)}",
+                )
+            blockchain_networks.append(net.lower())
+
+    async def _ndjson():
+        async for task in task_service.stream_tasks(
+            validation_types=validation_types,
+            blockchain_networks=blockchain_networks,
+            after=after,
+            limit=limit,
+        ):
+            yield orjson.dumps(task) + b"\n"
+
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
+
 @router.get("/{task_id}", response_model=TaskCreateResponseDTO)
 async def get_task_by_id(task_id: str) -> TaskCreateResponseDTO:
     """
@@ -3,7 +3,6 @@ SSO Service Layer.
 Contains business logic for SSO operations.
 """
 
-import json
 import uuid
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
@@ -43,7 +42,6 @@ class DecodeService:
         """
         Verify SSO token.
         """
-        print(f"Verifying SSO token: {request.sso_token}")
         sso_token = request.sso_token
         decode_validation_response = await validate_sso_token_external(sso_token)
 
@@ -67,7 +65,7 @@ class DecodeService:
             expires_at = parser.isoparse(expires_at)
         now = datetime.now(timezone.utc)
         expires_countdown = expires_at - now
-        session_id = str(uuid.uuid4())[:8]
+        session_id = uuid.uuid4().hex[:8]
         cache_key = f"deid_session_id:{session_id}"
 
         cache_service = await get_cache_service()
@@ -115,7 +113,7 @@ class DecodeService:
                 requestId=None,
             )
         except Exception as e:
-            print(f"Error parsing user data: {e}")
+            logger.error(f"Error parsing user data: {e}")
             return FetchUserDataResponseDTO(
                 success=False,
                 statusCode=500,
@@ -140,8 +138,6 @@ class DecodeService:
             # Clean the IPFS hash (remove ipfs:// prefix if present)
             clean_hash = ipfs_hash.replace("ipfs://", "")
 
-            print(f"Cleaned hash: {clean_hash}")
-
             # Fallback to public IPFS gateway
             metadata = await self._fetch_from_public_gateway(clean_hash)
             if metadata:
@@ -188,7 +184,6 @@ class DecodeService:
                 try:
                     async with httpx.AsyncClient(timeout=10.0) as client:
                         response = await client.get(gateway_url)
-                        print(f"IPFS Fetch Response: {response}")
                         response.raise_for_status()
 
                         metadata_dict = response.json()
@@ -209,7 +204,6 @@ class DecodeService:
         try:
             # Handle nested data structure if present
             data = metadata_dict.get("data", metadata_dict)
-            print(f"Raw metadata data: {json.dumps(data, indent=2, default=str)}")
 
             # Parse primary wallet with field name mapping
             primary_wallet_data = data.get("primary_wallet", {})
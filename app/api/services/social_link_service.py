@@ -3,16 +3,20 @@ Social Link Service Layer.
 Contains business logic for social account verification and linking with MongoDB storage.
 """
 
+import asyncio
 import base64
 import hashlib
 import json
 import secrets
+import time
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
 import httpx
+import orjson
 
 from app.api.dto.social_dto import (
     DiscordUserInfoDTO,
@@ -36,15 +40,67 @@ from app.domain.models.social_link import (
 from app.domain.repositories.social_link_repository import social_link_repository
 from app.infrastructure.blockchain.signature_utils import sign_message_with_private_key
 from app.infrastructure.cache.cache_service import cache_service
+from app.infrastructure.http import get_http_client
 
 logger = get_logger(__name__)
 
+# Google's token endpoint answers well under 2 s at P99; a tight budget keeps
+# slow-path failures from pinning connections for 30 s during brown-outs.
+_GOOGLE_TOKEN_TIMEOUT = httpx.Timeout(connect=2.0, read=3.0, write=2.0, pool=1.0)
+
+# Google userinfo cache: re-verify flows and rapid retries reuse the same
+# access token, so a short TTL saves the round-trip without serving stale data.
+_GOOGLE_USERINFO_TTL_SECONDS = 300
+_GOOGLE_USERINFO_CACHE_MAX_SIZE = 4096
+
+# DTO conversion runs per link on list responses; a prebuilt attrgetter pulls
+# all fields in one C-level call instead of 15 Python attribute lookups.
+_SOCIAL_LINK_DTO_KEYS = (
+    "id",
+    "user_id",
+    "platform",
+    "account_id",
+    "username",
+    "email",
+    "display_name",
+    "avatar_url",
+    "signature",
+    "verification_hash",
+    "status",
+    "tx_hash",
+    "block_number",
+    "created_at",
+    "updated_at",
+)
+_SOCIAL_LINK_DTO_GETTER = attrgetter(
+    "id",
+    "user_id",
+    "platform.value",
+    "account_id",
+    "username",
+    "email",
+    "display_name",
+    "avatar_url",
+    "signature",
+    "verification_hash",
+    "status.value",
+    "tx_hash",
+    "block_number",
+    "created_at",
+    "updated_at",
+)
+
 
 class SocialLinkService:
     """Service class for social account verification and linking."""
 
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         """Initialize social link service."""
+        # Optional injected client; falls back to the shared pooled client
+        self._http_client = http_client
+        # TTL cache for Google userinfo keyed by access-token hash
+        self._google_userinfo_cache: Dict[str, Tuple[float, GoogleUserInfoDTO]] = {}
+        self._google_userinfo_lock = asyncio.Lock()
         self.discord_api_base = "https://discord.com/api/v10"
         self.discord_oauth_base = "https://discord.com/oauth2"
         self.github_api_base = "https://api.github.com"
@@ -57,6 +113,27 @@ class SocialLinkService:
         self.x_oauth_token_url = "https://api.twitter.com/2/oauth2/token"
         self.x_api_base = "https://api.twitter.com/2"
 
+        # Precomputed token-exchange form templates.
+        # These fields are process constants; building them once avoids
+        # repeated settings lookups on every OAuth callback and keeps the
+        # per-request work down to merging in the authorization code.
+        self._discord_token_template = {
+            "client_id": settings.DISCORD_CLIENT_ID,
+            "client_secret": settings.DISCORD_CLIENT_SECRET,
+            "grant_type": "authorization_code",
+            "redirect_uri": settings.DISCORD_REDIRECT_URI,
+        }
+        self._github_token_template = {
+            "client_id": settings.GITHUB_CLIENT_ID,
+            "client_secret": settings.GITHUB_CLIENT_SECRET,
+        }
+        self._google_token_template = {
+            "client_id": settings.GOOGLE_CLIENT_ID,
+            "client_secret": settings.GOOGLE_CLIENT_SECRET,
+            "redirect_uri": settings.GOOGLE_REDIRECT_URI,
+            "grant_type": "authorization_code",
+        }
+
     async def get_discord_oauth_url(self, user_id: str) -> str:
         """
         Generate Discord OAuth authorization URL.
@@ -151,7 +228,7 @@ class SocialLinkService:
                         **self._convert_to_dto(existing_link),
                         "status": VerificationStatus.ALREADY_LINKED.value,
                     },
-                    request_id=str(uuid.uuid4()),
+                    request_id=uuid.uuid4().hex,
                 )
             else:
                 # Create new social link
@@ -188,7 +265,7 @@ class SocialLinkService:
                             status_code=200,
                             message="Discord account verified successfully",
                             data=self._convert_to_dto(created_link),
-                            request_id=str(uuid.uuid4()),
+                            request_id=uuid.uuid4().hex,
                         )
 
             return SocialVerificationResponseDTO(
@@ -216,45 +293,40 @@ class SocialLinkService:
                 raise ValueError("Discord client secret not configured")
 
             # Use proper form data encoding
-            data = {
-                "client_id": settings.DISCORD_CLIENT_ID,
-                "client_secret": settings.DISCORD_CLIENT_SECRET,
-                "grant_type": "authorization_code",
-                "code": code,
-                "redirect_uri": settings.DISCORD_REDIRECT_URI,
-            }
+            data = {**self._discord_token_template, "code": code}
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Method 1: Standard form data
-                try:
-                    response = await client.post(
-                        f"{self.discord_api_base}/oauth2/token",
-                        data=data,
-                        headers={
-                            "Content-Type": "application/x-www-form-urlencoded",
-                            "User-Agent": "DEiD-Social-Link/1.0",
-                        },
-                    )
+            client = self._http_client or get_http_client()
+            # Method 1: Standard form data
+            try:
+                response = await client.post(
+                    f"{self.discord_api_base}/oauth2/token",
+                    data=data,
+                    headers={
+                        "Content-Type": "application/x-www-form-urlencoded",
+                        "User-Agent": "DEiD-Social-Link/1.0",
+                    },
+                    timeout=30.0,
+                )
 
-                    if response.status_code == 200:
-                        content_type = response.headers.get("content-type", "")
-                        if "application/json" in content_type:
-                            token_data = response.json()
-                            access_token = token_data.get("access_token")
-                            if access_token:
-                                return access_token
-                            else:
-                                return None
+                if response.status_code == 200:
+                    content_type = response.headers.get("content-type", "")
+                    if "application/json" in content_type:
+                        token_data = response.json()
+                        access_token = token_data.get("access_token")
+                        if access_token:
+                            return access_token
                         else:
                             return None
                     else:
                         return None
-
-                except httpx.HTTPStatusError as e:
-                    return None
-                except Exception as e:
+                else:
                     return None
 
+            except httpx.HTTPStatusError as e:
+                return None
+            except Exception as e:
+                return None
+
         except Exception as e:
             logger.error(f"Error exchanging Discord code for token: {e}")
             return None
@@ -264,22 +336,22 @@ class SocialLinkService:
     ) -> Optional[DiscordUserInfoDTO]:
         """Get Discord user information using access token."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.discord_api_base}/users/@me",
-                    headers={"Authorization": f"Bearer {access_token}"},
-                )
-                response.raise_for_status()
-
-                user_data = response.json()
-                return DiscordUserInfoDTO(
-                    id=user_data["id"],
-                    username=user_data["username"],
-                    discriminator=user_data.get("discriminator", "0"),
-                    email=user_data.get("email"),
-                    verified=user_data.get("verified", False),
-                    avatar=user_data.get("avatar"),
-                )
+            client = self._http_client or get_http_client()
+            response = await client.get(
+                f"{self.discord_api_base}/users/@me",
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+            response.raise_for_status()
+
+            user_data = response.json()
+            return DiscordUserInfoDTO(
+                id=user_data["id"],
+                username=user_data["username"],
+                discriminator=user_data.get("discriminator", "0"),
+                email=user_data.get("email"),
+                verified=user_data.get("verified", False),
+                avatar=user_data.get("avatar"),
+            )
 
         except Exception as e:
             logger.error(f"Error getting Discord user info: {e}")
@@ -378,7 +450,7 @@ class SocialLinkService:
                         **self._convert_to_dto(existing_link),
                         "status": VerificationStatus.ALREADY_LINKED.value,
                     },
-                    request_id=str(uuid.uuid4()),
+                    request_id=uuid.uuid4().hex,
                 )
             else:
                 # Create new social link
@@ -410,7 +482,7 @@ class SocialLinkService:
                             status_code=200,
                             message="GitHub account verified successfully",
                             data=self._convert_to_dto(created_link),
-                            request_id=str(uuid.uuid4()),
+                            request_id=uuid.uuid4().hex,
                         )
 
             return SocialVerificationResponseDTO(
@@ -437,31 +509,28 @@ class SocialLinkService:
             if not settings.GITHUB_CLIENT_SECRET:
                 raise ValueError("GitHub client secret not configured")
 
-            data = {
-                "client_id": settings.GITHUB_CLIENT_ID,
-                "client_secret": settings.GITHUB_CLIENT_SECRET,
-                "code": code,
-            }
-
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.github_oauth_base}/access_token",
-                    data=data,
-                    headers={
-                        "Accept": "application/json",
-                        "User-Agent": "DEiD-Social-Link/1.0",
-                    },
-                )
+            data = {**self._github_token_template, "code": code}
+
+            client = self._http_client or get_http_client()
+            response = await client.post(
+                f"{self.github_oauth_base}/access_token",
+                data=data,
+                headers={
+                    "Accept": "application/json",
+                    "User-Agent": "DEiD-Social-Link/1.0",
+                },
+                timeout=30.0,
+            )
 
-                if response.status_code == 200:
-                    token_data = response.json()
-                    access_token = token_data.get("access_token")
-                    if access_token:
-                        return access_token
-                    else:
-                        return None
+            if response.status_code == 200:
+                token_data = response.json()
+                access_token = token_data.get("access_token")
+                if access_token:
+                    return access_token
                 else:
                     return None
+            else:
+                return None
 
         except Exception as e:
             logger.error(f"Error exchanging GitHub code for token: {e}")
@@ -472,35 +541,35 @@ class SocialLinkService:
     ) -> Optional[GitHubUserInfoDTO]:
         """Get GitHub user information using access token."""
         try:
-            async with httpx.AsyncClient() as client:
-                # Get user info from GitHub API
-                response = await client.get(
-                    f"{self.github_api_base}/user",
-                    headers={
-                        "Authorization": f"Bearer {access_token}",
-                        "Accept": "application/vnd.github.v3+json",
-                        "User-Agent": "DEiD-Social-Link/1.0",
-                    },
-                )
-                response.raise_for_status()
-
-                user_data = response.json()
-                return GitHubUserInfoDTO(
-                    id=user_data["id"],
-                    login=user_data["login"],
-                    name=user_data.get("name"),
-                    email=user_data.get("email"),
-                    avatar_url=user_data.get("avatar_url"),
-                    bio=user_data.get("bio"),
-                    blog=user_data.get("blog"),
-                    location=user_data.get("location"),
-                    public_repos=user_data.get("public_repos", 0),
-                    public_gists=user_data.get("public_gists", 0),
-                    followers=user_data.get("followers", 0),
-                    following=user_data.get("following", 0),
-                    created_at=user_data.get("created_at", ""),
-                    updated_at=user_data.get("updated_at", ""),
-                )
+            client = self._http_client or get_http_client()
+            # Get user info from GitHub API
+            response = await client.get(
+                f"{self.github_api_base}/user",
+                headers={
+                    "Authorization": f"Bearer {access_token}",
+                    "Accept": "application/vnd.github.v3+json",
+                    "User-Agent": "DEiD-Social-Link/1.0",
+                },
+            )
+            response.raise_for_status()
+
+            user_data = response.json()
+            return GitHubUserInfoDTO(
+                id=user_data["id"],
+                login=user_data["login"],
+                name=user_data.get("name"),
+                email=user_data.get("email"),
+                avatar_url=user_data.get("avatar_url"),
+                bio=user_data.get("bio"),
+                blog=user_data.get("blog"),
+                location=user_data.get("location"),
+                public_repos=user_data.get("public_repos", 0),
+                public_gists=user_data.get("public_gists", 0),
+                followers=user_data.get("followers", 0),
+                following=user_data.get("following", 0),
+                created_at=user_data.get("created_at", ""),
+                updated_at=user_data.get("updated_at", ""),
+            )
 
         except Exception as e:
             logger.error(f"Error getting GitHub user info: {e}")
@@ -601,7 +670,7 @@ class SocialLinkService:
                         **self._convert_to_dto(existing_link),
                         "status": VerificationStatus.ALREADY_LINKED.value,
                     },
-                    request_id=str(uuid.uuid4()),
+                    request_id=uuid.uuid4().hex,
                 )
             else:
                 # Create new social link
@@ -633,7 +702,7 @@ class SocialLinkService:
                             status_code=200,
                             message="Google account verified successfully",
                             data=self._convert_to_dto(created_link),
-                            request_id=str(uuid.uuid4()),
+                            request_id=uuid.uuid4().hex,
                         )
 
             return SocialVerificationResponseDTO(
@@ -660,33 +729,28 @@ class SocialLinkService:
             if not settings.GOOGLE_CLIENT_SECRET:
                 raise ValueError("Google client secret not configured")
 
-            data = {
-                "client_id": settings.GOOGLE_CLIENT_ID,
-                "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                "code": code,
-                "redirect_uri": settings.GOOGLE_REDIRECT_URI,
-                "grant_type": "authorization_code",
-            }
-
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://oauth2.googleapis.com/token",
-                    data=data,
-                    headers={
-                        "Content-Type": "application/x-www-form-urlencoded",
-                        "User-Agent": "DEiD-Social-Link/1.0",
-                    },
-                )
+            data = {**self._google_token_template, "code": code}
+
+            client = self._http_client or get_http_client()
+            response = await client.post(
+                "https://oauth2.googleapis.com/token",
+                data=data,
+                headers={
+                    "Content-Type": "application/x-www-form-urlencoded",
+                    "User-Agent": "DEiD-Social-Link/1.0",
+                },
+                timeout=_GOOGLE_TOKEN_TIMEOUT,
+            )
 
-                if response.status_code == 200:
-                    token_data = response.json()
-                    access_token = token_data.get("access_token")
-                    if access_token:
-                        return access_token
-                    else:
-                        return None
+            if response.status_code == 200:
+                token_data = orjson.loads(response.content)
+                access_token = token_data.get("access_token")
+                if access_token:
+                    return access_token
                 else:
                     return None
+            else:
+                return None
 
         except Exception as e:
             logger.error(f"Error exchanging Google code for token: {e}")
@@ -697,30 +761,57 @@ class SocialLinkService:
     ) -> Optional[GoogleUserInfoDTO]:
         """Get Google user information using access token."""
         try:
-            async with httpx.AsyncClient() as client:
-                # Get user info from Google API
-                response = await client.get(
-                    f"{self.google_api_base}/oauth2/v2/userinfo",
-                    headers={
-                        "Authorization": f"Bearer {access_token}",
-                        "Accept": "application/json",
-                        "User-Agent": "DEiD-Social-Link/1.0",
-                    },
-                )
-                response.raise_for_status()
-
-                user_data = response.json()
-                return GoogleUserInfoDTO(
-                    id=user_data["id"],
-                    email=user_data["email"],
-                    verified_email=user_data.get("verified_email", False),
-                    name=user_data.get("name"),
-                    given_name=user_data.get("given_name"),
-                    family_name=user_data.get("family_name"),
-                    picture=user_data.get("picture"),
-                    locale=user_data.get("locale"),
+            # Only a hash of the access token is used as the cache key
+            cache_key = hashlib.blake2b(
+                access_token.encode(), digest_size=16
+            ).hexdigest()
+            now = time.monotonic()
+
+            async with self._google_userinfo_lock:
+                cached = self._google_userinfo_cache.get(cache_key)
+                if cached:
+                    expires_at, user_info = cached
+                    if expires_at > now:
+                        return user_info
+                    del self._google_userinfo_cache[cache_key]
+
+            client = self._http_client or get_http_client()
+            # Get user info from Google API
+            response = await client.get(
+                f"{self.google_api_base}/oauth2/v2/userinfo",
+                headers={
+                    "Authorization": f"Bearer {access_token}",
+                    "Accept": "application/json",
+                    "User-Agent": "DEiD-Social-Link/1.0",
+                },
+            )
+            response.raise_for_status()
+
+            user_data = orjson.loads(response.content)
+            user_info = GoogleUserInfoDTO(
+                id=user_data["id"],
+                email=user_data["email"],
+                verified_email=user_data.get("verified_email", False),
+                name=user_data.get("name"),
+                given_name=user_data.get("given_name"),
+                family_name=user_data.get("family_name"),
+                picture=user_data.get("picture"),
+                locale=user_data.get("locale"),
+            )
+
+            async with self._google_userinfo_lock:
+                if len(self._google_userinfo_cache) >= _GOOGLE_USERINFO_CACHE_MAX_SIZE:
+                    # Drop the oldest entry (dicts preserve insertion order)
+                    self._google_userinfo_cache.pop(
+                        next(iter(self._google_userinfo_cache))
+                    )
+                self._google_userinfo_cache[cache_key] = (
+                    time.monotonic() + _GOOGLE_USERINFO_TTL_SECONDS,
+                    user_info,
                 )
 
+            return user_info
+
         except Exception as e:
             logger.error(f"Error getting Google user info: {e}")
             return None
@@ -822,7 +913,7 @@ class SocialLinkService:
                         **self._convert_to_dto(existing_link),
                         "status": VerificationStatus.ALREADY_LINKED.value,
                     },
-                    request_id=str(uuid.uuid4()),
+                    request_id=uuid.uuid4().hex,
                 )
             else:
                 # Create new social link
@@ -866,7 +957,7 @@ class SocialLinkService:
                             status_code=200,
                             message="Facebook account verified successfully",
                             data=self._convert_to_dto(created_link),
-                            request_id=str(uuid.uuid4()),
+                            request_id=uuid.uuid4().hex,
                         )
 
             return SocialVerificationResponseDTO(
@@ -900,25 +991,26 @@ class SocialLinkService:
                 "code": code,
             }
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    f"{self.facebook_api_base}/oauth/access_token",
-                    params=params,
-                    headers={
-                        "Accept": "application/json",
-                        "User-Agent": "DEiD-Social-Link/1.0",
-                    },
-                )
+            client = self._http_client or get_http_client()
+            response = await client.get(
+                f"{self.facebook_api_base}/oauth/access_token",
+                params=params,
+                headers={
+                    "Accept": "application/json",
+                    "User-Agent": "DEiD-Social-Link/1.0",
+                },
+                timeout=30.0,
+            )
 
-                if response.status_code == 200:
-                    token_data = response.json()
-                    access_token = token_data.get("access_token")
-                    if access_token:
-                        return access_token
-                    else:
-                        return None
+            if response.status_code == 200:
+                token_data = response.json()
+                access_token = token_data.get("access_token")
+                if access_token:
+                    return access_token
                 else:
                     return None
+            else:
+                return None
 
         except Exception as e:
             logger.error(f"Error exchanging Facebook code for token: {e}")
@@ -929,37 +1021,37 @@ class SocialLinkService:
     ) -> Optional[FacebookUserInfoDTO]:
         """Get Facebook user information using access token."""
         try:
-            async with httpx.AsyncClient() as client:
-                # Get user info from Facebook Graph API
-                # Note: email field requires 'email' permission which needs App Review
-                # For development, only request public_profile fields
-                params = {
-                    "fields": "id,name,first_name,last_name,picture.type(large)",
-                    "access_token": access_token,
-                }
-
-                response = await client.get(
-                    f"{self.facebook_api_base}/me",
-                    params=params,
-                    headers={
-                        "Accept": "application/json",
-                        "User-Agent": "DEiD-Social-Link/1.0",
-                    },
-                )
-                response.raise_for_status()
-
-                user_data = response.json()
-                return FacebookUserInfoDTO(
-                    id=user_data["id"],
-                    name=user_data.get("name"),
-                    email=user_data.get(
-                        "email"
-                    ),  # Will be None without email permission
-                    first_name=user_data.get("first_name"),
-                    last_name=user_data.get("last_name"),
-                    picture=user_data.get("picture"),
-                    locale=user_data.get("locale"),
-                )
+            client = self._http_client or get_http_client()
+            # Get user info from Facebook Graph API
+            # Note: email field requires 'email' permission which needs App Review
+            # For development, only request public_profile fields
+            params = {
+                "fields": "id,name,first_name,last_name,picture.type(large)",
+                "access_token": access_token,
+            }
+
+            response = await client.get(
+                f"{self.facebook_api_base}/me",
+                params=params,
+                headers={
+                    "Accept": "application/json",
+                    "User-Agent": "DEiD-Social-Link/1.0",
+                },
+            )
+            response.raise_for_status()
+
+            user_data = response.json()
+            return FacebookUserInfoDTO(
+                id=user_data["id"],
+                name=user_data.get("name"),
+                email=user_data.get(
+                    "email"
+                ),  # Will be None without email permission
+                first_name=user_data.get("first_name"),
+                last_name=user_data.get("last_name"),
+                picture=user_data.get("picture"),
+                locale=user_data.get("locale"),
+            )
 
         except Exception as e:
             logger.error(f"Error getting Facebook user info: {e}")
@@ -1121,7 +1213,7 @@ class SocialLinkService:
                         **self._convert_to_dto(existing_link),
                         "status": VerificationStatus.ALREADY_LINKED.value,
                     },
-                    request_id=str(uuid.uuid4()),
+                    request_id=uuid.uuid4().hex,
                 )
             else:
                 # Create new social link
@@ -1153,7 +1245,7 @@ class SocialLinkService:
                             status_code=200,
                             message="X account verified successfully",
                             data=self._convert_to_dto(created_link),
-                            request_id=str(uuid.uuid4()),
+                            request_id=uuid.uuid4().hex,
                         )
 
             return SocialVerificationResponseDTO(
@@ -1204,57 +1296,58 @@ class SocialLinkService:
             logger.info(f"Grant type: authorization_code")
             logger.info(f"Basic Auth header set: Yes")
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self.x_oauth_token_url,
-                    data=data,
-                    headers={
-                        "Authorization": f"Basic {basic_auth}",
-                        "Content-Type": "application/x-www-form-urlencoded",
-                        "User-Agent": "DEiD-Social-Link/1.0",
-                    },
-                )
+            client = self._http_client or get_http_client()
+            response = await client.post(
+                self.x_oauth_token_url,
+                data=data,
+                headers={
+                    "Authorization": f"Basic {basic_auth}",
+                    "Content-Type": "application/x-www-form-urlencoded",
+                    "User-Agent": "DEiD-Social-Link/1.0",
+                },
+                timeout=30.0,
+            )
 
-                logger.info(f"Response Status Code: {response.status_code}")
-                logger.info(f"Response Headers: {dict(response.headers)}")
-                logger.info(f"Response Body (raw): {response.text}")
-                logger.info(f"Response Body Length: {len(response.text)}")
+            logger.info(f"Response Status Code: {response.status_code}")
+            logger.info(f"Response Headers: {dict(response.headers)}")
+            logger.info(f"Response Body (raw): {response.text}")
+            logger.info(f"Response Body Length: {len(response.text)}")
 
-                if response.status_code == 200:
-                    # Check if response has content
-                    if not response.text:
-                        logger.error("✗ Response body is empty despite 200 status")
-                        return None
+            if response.status_code == 200:
+                # Check if response has content
+                if not response.text:
+                    logger.error("✗ Response body is empty despite 200 status")
+                    return None
 
-                    try:
-                        token_data = response.json()
-                        logger.info(f"Token response parsed successfully")
-                        logger.info(f"Token response keys: {list(token_data.keys())}")
+                try:
+                    token_data = response.json()
+                    logger.info(f"Token response parsed successfully")
+                    logger.info(f"Token response keys: {list(token_data.keys())}")
 
-                        access_token = token_data.get("access_token")
-                        if access_token:
-                            logger.info(
-                                f"✓ Access token received (length: {len(access_token)})"
-                            )
-                            return access_token
-                        else:
-                            logger.error(f"✗ No access token in response: {token_data}")
-                            return None
-                    except json.JSONDecodeError as e:
-                        logger.error(f"✗ Failed to parse JSON response: {e}")
-                        logger.error(f"Response text: {response.text[:500]}")
+                    access_token = token_data.get("access_token")
+                    if access_token:
+                        logger.info(
+                            f"✓ Access token received (length: {len(access_token)})"
+                        )
+                        return access_token
+                    else:
+                        logger.error(f"✗ No access token in response: {token_data}")
                         return None
-                else:
-                    logger.error(
-                        f"✗ Token exchange failed: {response.status_code} - {response.text}"
-                    )
-                    # Try to parse error response
-                    try:
-                        error_data = response.json()
-                        logger.error(f"Error details: {error_data}")
-                    except:
-                        pass
+                except json.JSONDecodeError as e:
+                    logger.error(f"✗ Failed to parse JSON response: {e}")
+                    logger.error(f"Response text: {response.text[:500]}")
                     return None
+            else:
+                logger.error(
+                    f"✗ Token exchange failed: {response.status_code} - {response.text}"
+                )
+                # Try to parse error response
+                try:
+                    error_data = response.json()
+                    logger.error(f"Error details: {error_data}")
+                except:
+                    pass
+                return None
 
         except Exception as e:
             logger.error(f"✗ Exception during X token exchange: {e}", exc_info=True)
@@ -1263,35 +1356,35 @@ class SocialLinkService:
     async def _get_x_user_info(self, access_token: str) -> Optional[XUserInfoDTO]:
         """Get X user information using access token."""
         try:
-            async with httpx.AsyncClient() as client:
-                # Get user info from X API v2
-                # Note: X API v2 does NOT provide email address
-                params = {
-                    "user.fields": "id,name,username,description,profile_image_url,verified,created_at"
-                }
-
-                response = await client.get(
-                    f"{self.x_api_base}/users/me",
-                    params=params,
-                    headers={
-                        "Authorization": f"Bearer {access_token}",
-                        "User-Agent": "DEiD-Social-Link/1.0",
-                    },
-                )
-                response.raise_for_status()
-
-                response_data = response.json()
-                user_data = response_data.get("data", {})
-
-                return XUserInfoDTO(
-                    id=user_data["id"],
-                    name=user_data.get("name"),
-                    username=user_data["username"],
-                    description=user_data.get("description"),
-                    profile_image_url=user_data.get("profile_image_url"),
-                    verified=user_data.get("verified"),
-                    created_at=user_data.get("created_at"),
-                )
+            client = self._http_client or get_http_client()
+            # Get user info from X API v2
+            # Note: X API v2 does NOT provide email address
+            params = {
+                "user.fields": "id,name,username,description,profile_image_url,verified,created_at"
+            }
+
+            response = await client.get(
+                f"{self.x_api_base}/users/me",
+                params=params,
+                headers={
+                    "Authorization": f"Bearer {access_token}",
+                    "User-Agent": "DEiD-Social-Link/1.0",
+                },
+            )
+            response.raise_for_status()
+
+            response_data = response.json()
+            user_data = response_data.get("data", {})
+
+            return XUserInfoDTO(
+                id=user_data["id"],
+                name=user_data.get("name"),
+                username=user_data["username"],
+                description=user_data.get("description"),
+                profile_image_url=user_data.get("profile_image_url"),
+                verified=user_data.get("verified"),
+                created_at=user_data.get("created_at"),
+            )
 
         except Exception as e:
             logger.error(f"Error getting X user info: {e}")
@@ -1309,9 +1402,13 @@ class SocialLinkService:
             # Sign the Discord account ID using existing signature utils
             verification_message = account_id
 
-            # Sign the message using existing signature utils (same as sync profile service)
-            signature, signer_address, message_hash = sign_message_with_private_key(
-                message=verification_message, private_key=settings.EVM_PRIVATE_KEY
+            # Sign the message using existing signature utils (same as sync profile
+            # service). Signing is CPU-bound secp256k1 work, so run it in a thread
+            # to keep the event loop free for concurrent callbacks.
+            signature, signer_address, message_hash = await asyncio.to_thread(
+                sign_message_with_private_key,
+                message=verification_message,
+                private_key=settings.EVM_PRIVATE_KEY,
             )
 
             return {
@@ -1328,6 +1425,7 @@ class SocialLinkService:
         self,
         tx_hash: str,
         platform: str,
+        account_id: str,
     ) -> SocialVerificationResponseDTO:
         """
         Confirm onchain verification and update status.
@@ -1341,28 +1439,45 @@ class SocialLinkService:
             SocialVerificationResponseDTO with confirmation result
         """
         try:
-            # Find the social link in database
-            social_link = await social_link_repository.get_social_link(
-                user_id="",  # We need to find by platform and account_id
+            # Find the social link via the (platform, account_id) index
+            social_link = await social_link_repository.get_social_link_by_platform_account(
                 platform=SocialPlatform(platform),
+                account_id=account_id,
             )
 
-            # Since we can't query by account_id directly, we need to find it
-            # This is a limitation of the current model - we might need to add an index
-            # For now, we'll need to implement a different approach
+            if not social_link:
+                return SocialVerificationResponseDTO(
+                    success=False,
+                    status_code=404,
+                    message="Social link not found",
+                    data=None,
+                    request_id=None,
+                )
 
             # Update status to onchain
             update_data = SocialLinkUpdateModel(
                 status=VerificationStatus.ONCHAIN, tx_hash=tx_hash
             )
 
-            # We need to find the link first - this is a design issue
-            # Let's implement a workaround by storing the user_id in the verification process
+            updated_link = await social_link_repository.update_social_link(
+                user_id=social_link.user_id,
+                platform=SocialPlatform(platform),
+                update_data=update_data,
+            )
+
+            if updated_link:
+                return SocialVerificationResponseDTO(
+                    success=True,
+                    status_code=200,
+                    message="Onchain verification confirmed successfully",
+                    data=self._convert_to_dto(updated_link),
+                    request_id=uuid.uuid4().hex,
+                )
 
             return SocialVerificationResponseDTO(
                 success=False,
-                status_code=501,
-                message="Onchain confirmation requires user_id - implementation needed",
+                status_code=500,
+                message="Failed to update social link",
                 data=None,
                 request_id=None,
             )
@@ -1393,7 +1508,26 @@ class SocialLinkService:
             SocialVerificationResponseDTO with confirmation result
         """
         try:
-            # Find the social link in database
+            # Atomically match user_id + platform + account_id and flip the
+            # status in one round-trip instead of a get followed by an update
+            updated_link = await social_link_repository.confirm_onchain(
+                user_id=user_id,
+                platform=SocialPlatform(platform),
+                account_id=account_id,
+                tx_hash=tx_hash,
+            )
+
+            if updated_link:
+                return SocialVerificationResponseDTO(
+                    success=True,
+                    status_code=200,
+                    message="Onchain verification confirmed successfully",
+                    data=self._convert_to_dto(updated_link),
+                    request_id=uuid.uuid4().hex,
+                )
+
+            # No match: only now pay an extra lookup to tell "not found"
+            # apart from "account ID mismatch"
             social_link = await social_link_repository.get_social_link(
                 user_id=user_id, platform=SocialPlatform(platform)
             )
@@ -1407,7 +1541,6 @@ class SocialLinkService:
                     request_id=None,
                 )
 
-            # Verify account_id matches
             if social_link.account_id != account_id:
                 return SocialVerificationResponseDTO(
                     success=False,
@@ -1417,34 +1550,14 @@ class SocialLinkService:
                     request_id=None,
                 )
 
-            # Update status to onchain
-            update_data = SocialLinkUpdateModel(
-                status=VerificationStatus.ONCHAIN, tx_hash=tx_hash
-            )
-
-            updated_link = await social_link_repository.update_social_link(
-                user_id=user_id,
-                platform=SocialPlatform(platform),
-                update_data=update_data,
+            return SocialVerificationResponseDTO(
+                success=False,
+                status_code=500,
+                message="Failed to update social link",
+                data=None,
+                request_id=None,
             )
 
-            if updated_link:
-                return SocialVerificationResponseDTO(
-                    success=True,
-                    status_code=200,
-                    message="Onchain verification confirmed successfully",
-                    data=self._convert_to_dto(updated_link),
-                    request_id=str(uuid.uuid4()),
-                )
-            else:
-                return SocialVerificationResponseDTO(
-                    success=False,
-                    status_code=500,
-                    message="Failed to update social link",
-                    data=None,
-                    request_id=None,
-                )
-
         except Exception as e:
             logger.error(f"Error confirming onchain verification: {e}")
             return SocialVerificationResponseDTO(
@@ -1548,20 +1661,4 @@ class SocialLinkService:
 
     def _convert_to_dto(self, social_link) -> Dict[str, Any]:
         """Convert social link model to DTO dictionary."""
-        return {
-            "id": social_link.id,
-            "user_id": social_link.user_id,
-            "platform": social_link.platform.value,
-            "account_id": social_link.account_id,
-            "username": social_link.username,
-            "email": social_link.email,
-            "display_name": social_link.display_name,
-            "avatar_url": social_link.avatar_url,
-            "signature": social_link.signature,
-            "verification_hash": social_link.verification_hash,
-            "status": social_link.status.value,
-            "tx_hash": social_link.tx_hash,
-            "block_number": social_link.block_number,
-            "created_at": social_link.created_at,
-            "updated_at": social_link.updated_at,
-        }
+        return dict(zip(_SOCIAL_LINK_DTO_KEYS, _SOCIAL_LINK_DTO_GETTER(social_link)))
@@ -3,59 +3,102 @@ Sync Profile Service.
 Builds calldata for DEiDProfile.createProfile via proxy after uploading metadata to IPFS.
 """
 
-import json
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
-from eth_abi import encode as abi_encode
+import orjson
+from eth_abi.codec import ABICodec
+from eth_abi.registry import registry as _abi_registry
 from eth_utils import to_checksum_address
+from pydantic import BaseModel
 
 from app.api.services.decode_service import DecodeService
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.infrastructure.blockchain.selectors import selector_for
-from app.infrastructure.blockchain.signature_utils import sign_message_with_private_key
+from app.infrastructure.blockchain.signature_utils import sign_message_detailed
+from app.infrastructure.http import get_http_client
 
 logger = get_logger(__name__)
 
+# Method selectors are pure functions of the signature literals; decode them
+# once at import time instead of on every calldata build.
+_CREATE_PROFILE_SELECTOR = bytes.fromhex(
+    selector_for("createProfile(string,string,bytes)")[2:]
+)
+_UPDATE_PROFILE_SELECTOR = bytes.fromhex(selector_for("updateProfile(string,bytes)")[2:])
+
+# Shared codec + frozen type tuples so eth_abi doesn't re-parse the type
+# strings on every calldata build.
+_ABI_CODEC = ABICodec(_abi_registry)
+_CREATE_PROFILE_TYPES = ("string", "string", "bytes")
+_UPDATE_PROFILE_TYPES = ("string", "bytes")
+
 
 class SyncProfileService:
     """Service to prepare on-chain profile creation calldata."""
 
-    def __init__(self) -> None:
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None) -> None:
         self.decode_service = DecodeService()
+        # Optional injected client; falls back to the shared pooled client
+        self._http_client = http_client
 
     async def upload_metadata_to_ipfs(self, metadata: Dict[str, Any]) -> Dict[str, str]:
         """Upload JSON metadata to Pinata if configured, else to self-hosted IPFS node."""
-        jsonable_metadata = json.loads(json.dumps(metadata, default=str))
+        # Serialize once; orjson emits compact bytes directly
+        payload = orjson.dumps(metadata, default=str)
 
         ipfs_url = settings.IPFS_GATEWAY_URL_POST
-        files = {
-            "file": (
-                "metadata.json",
-                json.dumps(jsonable_metadata, default=str),
-                "application/json",
+        client = self._http_client or get_http_client()
+
+        if "pinata" in ipfs_url and settings.IPFS_ACCESS_TOKEN:
+            # Pinata accepts a raw JSON body, which skips multipart framing
+            # on the wire and boundary parsing on the gateway
+            resp = await client.post(
+                ipfs_url,
+                content=payload,
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {settings.IPFS_ACCESS_TOKEN}",
+                },
+                timeout=20.0,
             )
-        }
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            resp = await client.post(ipfs_url, files=files)
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
+            ipfs_hash = data.get("IpfsHash") or (data.get("data") or {}).get("cid")
+        else:
+            # Legacy /api/v0/add gateways only accept multipart uploads
+            files = {
+                "file": (
+                    "metadata.json",
+                    payload,
+                    "application/json",
+                )
+            }
+            resp = await client.post(ipfs_url, files=files, timeout=20.0)
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
             ipfs_hash = data.get("Hash")
-            return {"uri": f"ipfs://{ipfs_hash}", "hash": ipfs_hash}
 
-    async def build_create_profile_calldata(
+        return {"uri": f"ipfs://{ipfs_hash}", "hash": ipfs_hash}
+
+    async def _prepare_metadata_and_signature(
         self, session_user_id: str, user_profile: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    ) -> Tuple[Dict[str, Any], str, str, str, Dict[str, Any], bytes]:
         """
-        Build calldata for createProfile(string username, string metadataURI, bytes validatorSignature).
+        Shared flow for the create/update calldata builders: validate the
+        Decode profile, upload metadata to IPFS, and sign the metadata URI.
 
         Args:
             session_user_id: The current authenticated user id (Decode ID)
             user_profile: The fetched user profile payload from Decode
 
         Returns:
-            Dict containing method, params, calldata (bytes hex), and metadataURI
+            Tuple of (metadata, metadata_uri, ipfs_hash, checksum_wallet,
+            validator, signature_bytes) where validator matches the dict
+            embedded in prepare responses and signature_bytes is the raw
+            signature for ABI encoding
         """
         data = user_profile.get("data") or {}
         username: str = data.get("username")
@@ -82,57 +125,84 @@ class SyncProfileService:
             "decode_user_id": session_user_id,
         }
 
-        # Upload to IPFS and form URI
-        print(f"Uploading metadata to IPFS")
-        ipfs_res = await self.upload_metadata_to_ipfs(metadata)
+        # Upload to IPFS and form URI. The upload runs as a task so local
+        # calldata prep overlaps with it; the validator signature itself
+        # cannot be overlapped because the signed payload is the metadataURI,
+        # which is only known once the upload returns.
+        upload_task = asyncio.create_task(self.upload_metadata_to_ipfs(metadata))
+        checksum_wallet = to_checksum_address(wallet_address)
+        ipfs_res = await upload_task
         metadata_uri = ipfs_res["uri"]
         ipfs_hash = ipfs_res["hash"]
-        print(f"Metadata URI: {metadata_uri}")
+        logger.debug("Metadata URI: %s", metadata_uri)
 
         # Backend validator signature (server signs ipfs_hash to attest validation)
         validator_signature = None
         validator_address = None
         validator_message_hash = None
+        signature_bytes = b""
 
-        print(f"EVM_PRIVATE_KEY configured: {(settings.EVM_PRIVATE_KEY)}")
         if settings.EVM_PRIVATE_KEY:
             try:
-                print(f"Signing IPFS hash: {ipfs_hash}")
-                validator_signature, validator_address, validator_message_hash = (
-                    sign_message_with_private_key(
-                        metadata_uri,
-                        settings.EVM_PRIVATE_KEY,
-                    )
+                sig = await asyncio.to_thread(
+                    sign_message_detailed,
+                    metadata_uri,
+                    settings.EVM_PRIVATE_KEY,
                 )
-                print(f"Signature created successfully: {validator_signature[:20]}...")
-                print(f"Signer address: {validator_address}")
+                validator_signature = sig.signature
+                validator_address = sig.signer
+                validator_message_hash = sig.message_hash
+                signature_bytes = sig.signature_bytes
             except Exception as e:
                 logger.error(f"Validator signing failed: {e}")
-                print(f"Signature error details: {e}")
         else:
-            print("EVM_PRIVATE_KEY not configured - skipping signature")
+            logger.warning("EVM_PRIVATE_KEY not configured - skipping signature")
+
+        validator = {
+            "signature": validator_signature,
+            "signer": validator_address,
+            "payload": ipfs_hash,
+            "message_hash": validator_message_hash,
+            "type": "personal_sign",
+        }
 
-        # Prepare calldata for createProfile(string,string,bytes)
-        checksum_wallet = to_checksum_address(wallet_address)
-        method_selector = bytes.fromhex(
-            selector_for("createProfile(string,string,bytes)")[2:]
+        return (
+            metadata,
+            metadata_uri,
+            ipfs_hash,
+            checksum_wallet,
+            validator,
+            signature_bytes,
         )
-        signature_bytes = (
-            bytes.fromhex(validator_signature[2:]) if validator_signature else b""
+
+    async def build_create_profile_calldata(
+        self, session_user_id: str, user_profile: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build calldata for createProfile(string username, string metadataURI, bytes validatorSignature).
+
+        Args:
+            session_user_id: The current authenticated user id (Decode ID)
+            user_profile: The fetched user profile payload from Decode
+
+        Returns:
+            Dict containing method, params, calldata (bytes hex), and metadataURI
+        """
+        metadata, metadata_uri, ipfs_hash, checksum_wallet, validator, signature_bytes = (
+            await self._prepare_metadata_and_signature(session_user_id, user_profile)
         )
-        args_encoded = abi_encode(
-            [
-                "string",
-                "string",
-                "bytes",
-            ],
+        username = metadata["username"]
+
+        # Prepare calldata for createProfile(string,string,bytes)
+        args_encoded = _ABI_CODEC.encode(
+            _CREATE_PROFILE_TYPES,
             [
                 username,
                 metadata_uri,
                 signature_bytes,
             ],
         )
-        calldata = "0x" + (method_selector + args_encoded).hex()
+        calldata = "0x" + (_CREATE_PROFILE_SELECTOR + args_encoded).hex()
 
         return {
             "method": "createProfile(string,string,bytes)",
@@ -144,31 +214,23 @@ class SyncProfileService:
             "calldata": calldata,
             "metadata": metadata,
             "ipfs_hash": ipfs_hash,
-            "validator": {
-                "signature": validator_signature,
-                "signer": validator_address,
-                "payload": ipfs_hash,
-                "message_hash": validator_message_hash,
-                "type": "personal_sign",
-            },
+            "validator": validator,
         }
 
     async def create_profile_prepare(self, user_id: str) -> Dict[str, Any]:
         """Fetch user data from Decode and return calldata + metadata URI."""
         # Reuse decode service to fetch profile by user id
         resp = await self.decode_service.get_my_profile(user_id)
-        print(f"Profile response")
         if not resp or not resp.success or not resp.data:
             raise ValueError("Failed to fetch user profile from Decode")
 
         # Convert DTO-like response to dict for uniform processing
-        if hasattr(resp, "model_dump"):
+        # (isinstance is a C-level check, cheaper than hasattr per call)
+        if isinstance(resp, BaseModel):
             profile_dict = resp.model_dump()
         else:
             profile_dict = dict(resp)
 
-        print(f"Profile dictionary")
-
         return await self.build_create_profile_calldata(user_id, profile_dict)
 
     async def build_update_profile_calldata(
@@ -184,69 +246,19 @@ class SyncProfileService:
         Returns:
             Dict containing method, params, calldata (bytes hex), and metadataURI
         """
-        data = user_profile.get("data") or {}
-        username: str = data.get("username")
-        display_name: Optional[str] = data.get("display_name")
-        bio: Optional[str] = data.get("bio")
-        avatar_ipfs_hash: Optional[str] = data.get("avatar_ipfs_hash")
-        primary_wallet = data.get("primary_wallet") or {}
-        wallet_address: str = primary_wallet.get("address")
-        wallets = data.get("wallets") or []
-
-        if not username:
-            raise ValueError("username missing from Decode profile")
-        if not wallet_address:
-            raise ValueError("primary wallet address missing from Decode profile")
-
-        # Build metadata JSON
-        metadata: Dict[str, Any] = {
-            "username": username,
-            "display_name": display_name,
-            "bio": bio,
-            "avatar_ipfs_hash": avatar_ipfs_hash,
-            "primary_wallet": primary_wallet,
-            "wallets": wallets,
-            "decode_user_id": session_user_id,
-        }
-
-        # Upload to IPFS and form URI
-        print(f"Uploading updated metadata to IPFS")
-        ipfs_res = await self.upload_metadata_to_ipfs(metadata)
-        metadata_uri = ipfs_res["uri"]
-        ipfs_hash = ipfs_res["hash"]
-        print(f"Updated metadata URI: {metadata_uri}")
-
-        # Backend validator signature (server signs ipfs_hash to attest validation)
-        validator_signature = None
-        validator_address = None
-        validator_message_hash = None
-        if settings.EVM_PRIVATE_KEY:
-            try:
-                validator_signature, validator_address, validator_message_hash = (
-                    sign_message_with_private_key(
-                        metadata_uri,
-                        settings.EVM_PRIVATE_KEY,
-                    )
-                )
-            except Exception as e:
-                logger.error(f"Validator signing failed: {e}")
+        metadata, metadata_uri, ipfs_hash, _checksum_wallet, validator, signature_bytes = (
+            await self._prepare_metadata_and_signature(session_user_id, user_profile)
+        )
 
         # Prepare calldata for updateProfile(string,bytes)
-        method_selector = bytes.fromhex(selector_for("updateProfile(string,bytes)")[2:])
-        signature_bytes = (
-            bytes.fromhex(validator_signature[2:]) if validator_signature else b""
-        )
-        args_encoded = abi_encode(
-            [
-                "string",
-                "bytes",
-            ],
+        args_encoded = _ABI_CODEC.encode(
+            _UPDATE_PROFILE_TYPES,
             [
                 metadata_uri,
                 signature_bytes,
             ],
         )
-        calldata = "0x" + (method_selector + args_encoded).hex()
+        calldata = "0x" + (_UPDATE_PROFILE_SELECTOR + args_encoded).hex()
 
         return {
             "method": "updateProfile(string,bytes)",
@@ -256,29 +268,21 @@ class SyncProfileService:
             "calldata": calldata,
             "metadata": metadata,
             "ipfs_hash": ipfs_hash,
-            "validator": {
-                "signature": validator_signature,
-                "signer": validator_address,
-                "payload": ipfs_hash,
-                "message_hash": validator_message_hash,
-                "type": "personal_sign",
-            },
+            "validator": validator,
         }
 
     async def update_profile_prepare(self, user_id: str) -> Dict[str, Any]:
         """Fetch user data from Decode and return update calldata + metadata URI."""
         # Reuse decode service to fetch profile by user id
         resp = await self.decode_service.get_my_profile(user_id)
-        print(f"Update profile response")
         if not resp or not resp.success or not resp.data:
             raise ValueError("Failed to fetch user profile from Decode")
 
         # Convert DTO-like response to dict for uniform processing
-        if hasattr(resp, "model_dump"):
+        # (isinstance is a C-level check, cheaper than hasattr per call)
+        if isinstance(resp, BaseModel):
             profile_dict = resp.model_dump()
         else:
             profile_dict = dict(resp)
 
-        print(f"Update profile dictionary")
-
         return await self.build_update_profile_calldata(user_id, profile_dict)
@@ -3,15 +3,20 @@ Task Service Layer.
 Contains business logic for task management and smart contract integration.
 """
 
+import asyncio
 import json
+import logging
+import time
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 
 from app.api.dto.task_dto import (
-    BadgeDetail,
     OriginTaskCreateRequestDTO,
     TaskValidationDataDTO,
     TaskValidationResponseDTO,
 )
+from app.core.batching import MicroBatcher
 from app.core.config import settings
 from app.core.decode_external_service import get_decode_profile_external
 from app.core.logging import get_logger
@@ -28,10 +33,95 @@ from app.infrastructure.blockchain.signature_utils import (
     sign_message_with_private_key,
     sign_user_task_message,
 )
+from app.infrastructure.cache import cache_service
 from app.infrastructure.ipfs.ipfs_service import ipfs_service
 
 logger = get_logger(__name__)
 
+_BADGE_SYSTEM_ABI_PATH = "app/contracts/verification/BadgeSystem.sol/BadgeSystem.json"
+
+
+def _load_badge_system_abi() -> List[Dict]:
+    """Load and parse the BadgeSystem contract ABI from disk."""
+    with open(_BADGE_SYSTEM_ABI_PATH, "r") as f:
+        return json.load(f)["abi"]
+
+
+# Parse the ABI once at import instead of on first contract call; if the
+# artifact is missing the error is deferred to first use.
+try:
+    _BADGE_SYSTEM_ABI: Optional[List[Dict]] = _load_badge_system_abi()
+except Exception:
+    _BADGE_SYSTEM_ABI = None
+
+
+# Serialization runs per row on list pages; a prebuilt itemgetter pulls the
+# always-present fields in one C-level call. tx_hash/block_number are $set
+# only after the contract call, so they still go through .get.
+_TASK_FIELDS = (
+    "task_title",
+    "task_description",
+    "validation_type",
+    "blockchain_network",
+    "token_contract_address",
+    "minimum_balance",
+    "badge_details",
+)
+_task_getter = itemgetter(*_TASK_FIELDS)
+
+
+def _iso(dt) -> Optional[str]:
+    """Render a datetime as ISO-8601, passing None through."""
+    return dt.isoformat() if dt else None
+
+
+# Task documents are effectively immutable once their badge is on-chain, so a
+# short TTL cache collapses the per-user Mongo lookup for hot tasks.
+_TASK_CACHE_TTL_SECONDS = 60
+_TASK_CACHE_MAX_SIZE = 1024
+
+# Validation results are deterministic per (task, user) signature, so repeat
+# validators can be answered from Redis without re-running the RPC balance
+# check or re-signing. Redis being unavailable degrades to the full path.
+_VALIDATION_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60  # 30 days
+
+
+def _validation_cache_key(task_id: str, user_id: str) -> str:
+    """Build the Redis key for a stored (task, user) validation result."""
+    return f"task_validation:{task_id}:{user_id}"
+
+# RPC endpoints are fixed per process; freeze the lookup table at import
+# instead of rebuilding a dict on every validation request.
+_RPC_URL_BY_NETWORK = MappingProxyType(
+    {
+        BlockchainNetwork.ETHEREUM.value: settings.ETHEREUM_RPC_URL,
+        BlockchainNetwork.BINANCE_SMART_CHAIN.value: settings.BSC_RPC_URL,
+        BlockchainNetwork.BASE.value: settings.BASE_RPC_URL,
+    }
+)
+
+
+class _ValidationBatcher(MicroBatcher):
+    """
+    Micro-batches successful task validations into a single insert_many.
+
+    A newly launched task produces a burst of validations; draining the
+    queue for a few milliseconds and issuing one bulk insert amortizes the
+    per-record round trip. Each caller awaits its own future, resolved once
+    the batch containing its record lands.
+    """
+
+    failure_result = False
+
+    async def _execute(self, items) -> None:
+        """Insert one batch of validations and resolve its futures."""
+        inserted = await task_repository.insert_many_validations(
+            [validation for validation, _ in items]
+        )
+        for _, future in items:
+            if not future.done():
+                future.set_result(inserted > 0)
+
 
 class TaskService:
     """Service class for task management."""
@@ -39,24 +129,63 @@ class TaskService:
     def __init__(self):
         """Initialize task service."""
         self.contract_client = None
+        self._contract_client_lock = asyncio.Lock()
+        self._task_cache: Dict[str, Tuple[float, dict]] = {}
+        self._task_cache_lock = asyncio.Lock()
+        self._validation_batcher = _ValidationBatcher()
 
     async def _get_contract_client(self) -> ContractClient:
         """Get or create contract client instance."""
         if not self.contract_client:
-            # Load BadgeSystem ABI
-            with open(
-                "app/contracts/verification/BadgeSystem.sol/BadgeSystem.json", "r"
-            ) as f:
-                badge_system_abi = json.load(f)["abi"]
+            # Lock so concurrent callers don't construct duplicate clients
+            async with self._contract_client_lock:
+                if not self.contract_client:
+                    badge_system_abi = _BADGE_SYSTEM_ABI
+                    if badge_system_abi is None:
+                        badge_system_abi = _load_badge_system_abi()
+
+                    if not settings.PROXY_ADDRESS:
+                        raise ValueError("PROXY_ADDRESS not configured in environment")
+
+                    self.contract_client = ContractClient(
+                        contract_address=settings.PROXY_ADDRESS, abi=badge_system_abi
+                    )
 
-            if not settings.PROXY_ADDRESS:
-                raise ValueError("PROXY_ADDRESS not configured in environment")
+        return self.contract_client
 
-            self.contract_client = ContractClient(
-                contract_address=settings.PROXY_ADDRESS, abi=badge_system_abi
-            )
+    async def _get_task_cached(self, task_id: str) -> Optional[Dict]:
+        """
+        Get a task document, serving hot task_ids from a short TTL cache.
 
-        return self.contract_client
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Task document or None if not found
+        """
+        now = time.monotonic()
+
+        async with self._task_cache_lock:
+            entry = self._task_cache.get(task_id)
+            if entry and entry[0] > now:
+                return entry[1]
+
+        task = await task_repository.get_task_by_id(task_id)
+
+        if task:
+            async with self._task_cache_lock:
+                if len(self._task_cache) >= _TASK_CACHE_MAX_SIZE:
+                    oldest_key = min(
+                        self._task_cache, key=lambda k: self._task_cache[k][0]
+                    )
+                    self._task_cache.pop(oldest_key, None)
+                self._task_cache[task_id] = (now + _TASK_CACHE_TTL_SECONDS, task)
+
+        return task
+
+    def _invalidate_task_cache(self, task_id: str) -> None:
+        """Drop a task from the TTL cache after it changes."""
+        self._task_cache.pop(task_id, None)
 
     async def create_task(
         self, task_request: OriginTaskCreateRequestDTO
@@ -77,18 +206,11 @@ class TaskService:
             Tuple of (success, message, task_data)
         """
         try:
-            # Step 1: Prepare badge metadata for IPFS
-            badge_metadata = self._prepare_badge_metadata(task_request.badge_details)
+            # Step 1: Prepare badge metadata for IPFS. Dump the badge details
+            # once; both the IPFS metadata and the stored task derive from it
+            badge_details_dump = task_request.badge_details.model_dump()
+            badge_metadata = self._prepare_badge_metadata(badge_details_dump)
 
-            # Upload to IPFS
-            ipfs_hash = await ipfs_service.upload_badge_metadata(badge_metadata)
-            if not ipfs_hash:
-                return False, "Failed to upload badge metadata to IPFS", None
-
-            metadata_uri = ipfs_service.get_ipfs_url(ipfs_hash)
-            logger.info(f"Badge metadata uploaded to IPFS: {ipfs_hash}")
-
-            # Step 2: Save task to MongoDB
             task_model = TaskModel(
                 task_title=task_request.task_title,
                 task_description=task_request.task_description,
@@ -96,12 +218,31 @@ class TaskService:
                 blockchain_network=task_request.blockchain_network,
                 token_contract_address=task_request.token_contract_address,
                 minimum_balance=task_request.minimum_balance,
-                badge_details=task_request.badge_details.model_dump(),
+                badge_details=badge_details_dump,
+            )
+
+            # Steps 1+2 are independent (the URI is only needed for the
+            # on-chain call), so overlap the IPFS upload with the Mongo insert
+            ipfs_hash, created_task = await asyncio.gather(
+                ipfs_service.upload_badge_metadata(badge_metadata),
+                task_repository.create_task(task_model),
             )
 
-            created_task = await task_repository.create_task(task_model)
             task_id = str(created_task["_id"])
-            logger.info(f"Task created in MongoDB with ID: {task_id}")
+            logger.info("Task created in MongoDB with ID: %s", task_id)
+
+            if not ipfs_hash:
+                # The insert already landed; record the failure on the task
+                # instead of leaving an unmarked orphan
+                await task_repository.mark_task_ipfs_failed(task_id)
+                return (
+                    False,
+                    "Failed to upload badge metadata to IPFS",
+                    self._serialize_task(created_task),
+                )
+
+            metadata_uri = ipfs_service.get_ipfs_url(ipfs_hash)
+            logger.info("Badge metadata uploaded to IPFS: %s", ipfs_hash)
 
             # Step 3: Create badge on smart contract
             try:
@@ -118,18 +259,19 @@ class TaskService:
                     tx_hash = tx_receipt["transactionHash"].hex()
                     block_number = tx_receipt["blockNumber"]
 
-                    # Step 4: Update task with transaction info
-                    await task_repository.update_task_contract_data(
+                    # Step 4: Update task with transaction info; the updated
+                    # document comes back in the same round trip
+                    updated_task = await task_repository.update_task_contract_data(
                         task_id, tx_hash, block_number
                     )
+                    self._invalidate_task_cache(task_id)
 
                     logger.info(
-                        f"Badge created on-chain: tx_hash={tx_hash}, block={block_number}"
+                        "Badge created on-chain: tx_hash=%s, block=%s",
+                        tx_hash,
+                        block_number,
                     )
 
-                    # Retrieve updated task
-                    updated_task = await task_repository.get_task_by_id(task_id)
-
                     return (
                         True,
                         "Task and badge created successfully",
@@ -162,42 +304,90 @@ class TaskService:
         page_size: int = 10,
         validation_types: Optional[List[str]] = None,
         blockchain_networks: Optional[List[str]] = None,
-    ) -> Tuple[List[Dict], int, int]:
+        after: Optional[str] = None,
+        include_total: bool = False,
+    ) -> Tuple[List[Dict], Optional[int], Optional[int], Optional[str], bool]:
         """
         Get paginated list of tasks.
 
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed, ignored when `after` is set)
             page_size: Number of items per page
             validation_types: Optional filter by validation types (list of erc20_balance_check, erc721_balance_check)
             blockchain_networks: Optional filter by blockchain networks (list of ethereum, bsc, base)
+            after: Optional cursor (id of the last task from the previous page)
+            include_total: Also run the total count query (skipped by default)
 
         Returns:
-            Tuple of (tasks list, total count, total pages)
+            Tuple of (tasks list, total count or None, total pages or None,
+            next cursor, has_next)
         """
         try:
-            # Calculate skip
+            # Calculate skip (unused on the cursor path)
             skip = (page - 1) * page_size
 
-            # Get tasks and total count
+            # Repository fetches one extra row so has_next needs no count
             tasks, total_count = await task_repository.get_tasks_paginated(
                 skip=skip,
                 limit=page_size,
                 validation_types=validation_types,
                 blockchain_networks=blockchain_networks,
+                after=after,
+                include_total=include_total,
             )
 
-            # Calculate total pages
-            total_pages = (total_count + page_size - 1) // page_size
+            has_next = len(tasks) > page_size
+            if has_next:
+                tasks = tasks[:page_size]
+
+            # Calculate total pages when the count was requested
+            total_pages = (
+                (total_count + page_size - 1) // page_size
+                if total_count is not None
+                else None
+            )
 
             # Serialize tasks
             serialized_tasks = [self._serialize_task(task) for task in tasks]
 
-            return serialized_tasks, total_count, total_pages
+            # Expose the last id of a full page as the next-page cursor
+            next_cursor = serialized_tasks[-1]["id"] if has_next else None
+
+            return serialized_tasks, total_count, total_pages, next_cursor, has_next
 
         except Exception as e:
             logger.error(f"Error getting tasks: {e}")
-            return [], 0, 0
+            return [], 0, 0, None, False
+
+    async def stream_tasks(
+        self,
+        validation_types: Optional[List[str]] = None,
+        blockchain_networks: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 1000,
+    ):
+        """
+        Stream serialized tasks newest-first as an async generator.
+
+        Each row is serialized as it comes off the Mongo cursor, keeping
+        peak memory flat and time-to-first-row low on large listings.
+
+        Args:
+            validation_types: Optional filter by validation types
+            blockchain_networks: Optional filter by blockchain networks
+            after: Optional cursor (id of the last task already seen)
+            limit: Maximum number of tasks to yield
+
+        Yields:
+            Serialized task dictionaries
+        """
+        async for task in task_repository.iter_tasks(
+            validation_types=validation_types,
+            blockchain_networks=blockchain_networks,
+            after=after,
+            limit=limit,
+        ):
+            yield self._serialize_task(task)
 
     async def get_task_by_id(self, task_id: str) -> Optional[Dict]:
         """
@@ -218,23 +408,23 @@ class TaskService:
             logger.error(f"Error getting task by ID: {e}")
             return None
 
-    def _prepare_badge_metadata(self, badge_details: BadgeDetail) -> Dict:
+    def _prepare_badge_metadata(self, badge_details: Dict) -> Dict:
         """
         Prepare badge metadata for IPFS upload.
 
         Args:
-            badge_details: Badge details from request
+            badge_details: Dumped badge details from the request
 
         Returns:
             Badge metadata dictionary
         """
         return {
-            "name": badge_details.badge_name,
-            "description": badge_details.badge_description,
-            "image": f"ipfs://{badge_details.badge_image}",
+            "name": badge_details["badge_name"],
+            "description": badge_details["badge_description"],
+            "image": f"ipfs://{badge_details['badge_image']}",
             "attributes": [
-                {"trait_type": attr.trait_type, "value": attr.value}
-                for attr in badge_details.attributes
+                {"trait_type": attr["trait_type"], "value": attr["value"]}
+                for attr in badge_details["attributes"]
             ],
         }
 
@@ -251,25 +441,13 @@ class TaskService:
         if not task:
             return None
 
+        task_data = dict(zip(_TASK_FIELDS, _task_getter(task)))
         # Convert ObjectId to string
-        task_data = {
-            "id": str(task["_id"]),
-            "task_title": task.get("task_title"),
-            "task_description": task.get("task_description"),
-            "validation_type": task.get("validation_type"),
-            "blockchain_network": task.get("blockchain_network"),
-            "token_contract_address": task.get("token_contract_address"),
-            "minimum_balance": task.get("minimum_balance"),
-            "badge_details": task.get("badge_details"),
-            "tx_hash": task.get("tx_hash"),
-            "block_number": task.get("block_number"),
-            "created_at": (
-                task.get("created_at").isoformat() if task.get("created_at") else None
-            ),
-            "updated_at": (
-                task.get("updated_at").isoformat() if task.get("updated_at") else None
-            ),
-        }
+        task_data["id"] = str(task["_id"])
+        task_data["tx_hash"] = task.get("tx_hash")
+        task_data["block_number"] = task.get("block_number")
+        task_data["created_at"] = _iso(task.get("created_at"))
+        task_data["updated_at"] = _iso(task.get("updated_at"))
 
         return task_data
 
@@ -296,9 +474,13 @@ class TaskService:
             TaskValidationResponseDTO with validation result and signature
         """
         try:
-            # Step 1: Fetch user profile from Decode
-            logger.info(f"Validating task {task_id} for user {user_id}")
-            user_profile = await get_decode_profile_external(user_id)
+            # Steps 1+3 are independent: overlap the external profile fetch
+            # with the Mongo task lookup
+            logger.info("Validating task %s for user %s", task_id, user_id)
+            user_profile, task_data = await asyncio.gather(
+                get_decode_profile_external(user_id),
+                self._get_task_cached(task_id),
+            )
 
             if not user_profile or not user_profile.get("success"):
                 return TaskValidationResponseDTO(
@@ -323,41 +505,49 @@ class TaskService:
                 )
 
             wallet_address = primary_wallet["address"]
-            logger.info(f"User {user_id} primary wallet: {wallet_address}")
+            logger.info("User %s primary wallet: %s", user_id, wallet_address)
 
-            # Step 3: Get task details
-            task_data = await task_repository.get_task_by_id(task_id)
+            # Step 3: Check task details (fetched above)
             if not task_data:
                 return TaskValidationResponseDTO(
                     success=False, message="Task not found", data=None
                 )
 
-            # Step 4: Check if user already validated this task
-            # existing_validation = await task_repository.get_user_task_validation(
-            #     user_id, task_id
-            # )
-
-            # if existing_validation:
-            #     logger.info(
-            #         f"User {user_id} already validated task {task_id}, returning existing validation"
-            #     )
-            #     return TaskValidationResponseDTO(
-            #         success=True,
-            #         message="Task already validated for this user",
-            #         data=TaskValidationDataDTO(
-            #             task_id=task_id,
-            #             user_wallet=wallet_address,
-            #             actual_balance=str(
-            #                 existing_validation.get("actual_balance", "0")
-            #             ),
-            #             required_balance=str(task_data.get("minimum_balance", 0)),
-            #             signature=existing_validation.get("signature", ""),
-            #             verification_hash=existing_validation.get(
-            #                 "verification_hash", ""
-            #             ),
-            #             task_details=self._serialize_task(task_data),
-            #         ),
-            #     )
+            # Step 4: Check if user already validated this task. The check is
+            # Redis-backed so the repeat path is one in-memory lookup instead
+            # of the RPC balance check + signing; a Redis error falls through
+            # to full validation.
+            try:
+                existing_validation = await cache_service.get(
+                    _validation_cache_key(task_id, user_id)
+                )
+            except Exception as e:
+                logger.warning("Validation cache lookup failed: %s", e)
+                existing_validation = None
+
+            if existing_validation:
+                logger.info(
+                    "User %s already validated task %s, returning cached validation",
+                    user_id,
+                    task_id,
+                )
+                return TaskValidationResponseDTO(
+                    success=True,
+                    message="Task already validated for this user",
+                    data=TaskValidationDataDTO(
+                        task_id=task_id,
+                        user_wallet=wallet_address,
+                        actual_balance=str(
+                            existing_validation.get("actual_balance", "0")
+                        ),
+                        required_balance=str(task_data.get("minimum_balance", 0)),
+                        signature=existing_validation.get("signature", ""),
+                        verification_hash=existing_validation.get(
+                            "verification_hash", ""
+                        ),
+                        task_details=self._serialize_task(task_data),
+                    ),
+                )
 
             # Step 5: Get RPC URL based on blockchain network
             blockchain_network = task_data.get("blockchain_network")
@@ -375,21 +565,24 @@ class TaskService:
             token_contract_address = task_data.get("token_contract_address")
             minimum_balance = task_data.get("minimum_balance", 0)
 
-            is_valid = False
-            actual_balance = 0
-            logger.info(
-                f"Validating balance for user {user_id} on network {blockchain_network}"
-            )
+            # The signature only binds wallet_address + task_id (both already
+            # known), so its key must exist before we start any chain work.
+            # Checked before the balance coroutine is built so the early
+            # return doesn't leave an un-awaited coroutine behind.
+            if not settings.EVM_PRIVATE_KEY:
+                return TaskValidationResponseDTO(
+                    success=False, message="EVM private key not configured", data=None
+                )
 
             if validation_type == ValidationType.ERC20_BALANCE_CHECK.value:
-                is_valid, actual_balance = await balance_validator.check_erc20_balance(
+                balance_coro = balance_validator.check_erc20_balance(
                     wallet_address=wallet_address,
                     token_contract_address=token_contract_address,
                     minimum_balance=minimum_balance,
                     rpc_url=rpc_url,
                 )
             elif validation_type == ValidationType.ERC721_BALANCE_CHECK.value:
-                is_valid, actual_balance = await balance_validator.check_erc721_balance(
+                balance_coro = balance_validator.check_erc721_balance(
                     wallet_address=wallet_address,
                     nft_contract_address=token_contract_address,
                     minimum_balance=minimum_balance,
@@ -402,29 +595,48 @@ class TaskService:
                     data=None,
                 )
 
+            logger.info(
+                "Validating balance for user %s on network %s",
+                user_id,
+                blockchain_network,
+            )
+
+            # Steps 6+7: sign speculatively while the balance check runs. The
+            # CPU-bound secp256k1 work happens in a worker thread so concurrent
+            # validations don't queue on the loop; a failed balance check just
+            # discards the signature.
+            sign_task = asyncio.create_task(
+                asyncio.to_thread(
+                    sign_user_task_message,
+                    user_address=wallet_address,
+                    task_id=task_id,
+                    private_key=settings.EVM_PRIVATE_KEY,
+                )
+            )
+
+            try:
+                is_valid, actual_balance = await balance_coro
+            except Exception:
+                sign_task.cancel()
+                raise
+
             if not is_valid:
+                sign_task.cancel()
                 return TaskValidationResponseDTO(
                     success=False,
                     message=f"Insufficient balance. Required: {minimum_balance}, Actual: {actual_balance}",
                     data=None,
                 )
 
-            # Step 7: Sign user_address + task_id using EVM_PRIVATE_KEY
-            # This prevents signature reuse attacks by binding the signature to the specific user
-            if not settings.EVM_PRIVATE_KEY:
-                return TaskValidationResponseDTO(
-                    success=False, message="EVM private key not configured", data=None
-                )
-
-            signature, signer_address, verification_hash = sign_user_task_message(
-                user_address=wallet_address,
-                task_id=task_id,
-                private_key=settings.EVM_PRIVATE_KEY,
-            )
+            signature, signer_address, verification_hash = await sign_task
 
-            logger.info(
-                f"Generated signature for task {task_id}: {signature[:20]}... (signer: {signer_address})"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Generated signature for task %s: %s... (signer: %s)",
+                    task_id,
+                    signature[:20],
+                    signer_address,
+                )
 
             # Step 8: Store successful validation
             validation_model = TaskValidationModel(
@@ -436,7 +648,29 @@ class TaskService:
                 verification_hash=verification_hash,
             )
 
-            await task_repository.create_task_validation(validation_model)
+            # Batched with concurrent validations of the same burst
+            persisted = await self._validation_batcher.submit(validation_model)
+            if not persisted:
+                return TaskValidationResponseDTO(
+                    success=False,
+                    message="Failed to store validation result",
+                    data=None,
+                )
+
+            # Remember the result so repeat validators skip the chain work;
+            # best effort, the Mongo record above remains the source of truth
+            try:
+                await cache_service.set(
+                    _validation_cache_key(task_id, user_id),
+                    {
+                        "actual_balance": str(actual_balance),
+                        "signature": signature,
+                        "verification_hash": verification_hash,
+                    },
+                    expire=_VALIDATION_CACHE_TTL_SECONDS,
+                )
+            except Exception as e:
+                logger.warning("Validation cache store failed: %s", e)
 
             # Step 9: Return validation response
             return TaskValidationResponseDTO(
@@ -469,13 +703,7 @@ class TaskService:
         Returns:
             RPC URL or None if unsupported
         """
-        network_mapping = {
-            BlockchainNetwork.ETHEREUM.value: settings.ETHEREUM_RPC_URL,
-            BlockchainNetwork.BINANCE_SMART_CHAIN.value: settings.BSC_RPC_URL,
-            BlockchainNetwork.BASE.value: settings.BASE_RPC_URL,
-        }
-
-        return network_mapping.get(blockchain_network)
+        return _RPC_URL_BY_NETWORK.get(blockchain_network)
 
 
 # Global service instance
@@ -3,405 +3,73 @@ HTML response templates for OAuth callbacks (DEiD).
 Modern dark theme style, using Inter font and solid color palette.
 """
 
+import re
+import sys
+from functools import lru_cache
+from html import escape
 from typing import Optional
 
+# Page shells are built once at import; each render only substitutes the
+# handful of dynamic fields. The styling lives in /deid-oauth.css (served
+# from the public mount) so the browser caches it across the success /
+# already-linked / error flows and each HTML body stays ~1 KB.
 
-def get_oauth_success_template(
-    platform: str, username: str, account_id: str, status: str, signature: str
-) -> str:
-    """
-    Generate HTML template for successful OAuth verification.
-    """
-    return f"""<!DOCTYPE html>
+_SUCCESS_TPL = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{platform.title()} Verification Success - DEiD</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800;900&display=swap" rel="stylesheet">
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #000000;
-            min-height: 100vh;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            padding: 2rem;
-            color: #FFFFFF;
-        }}
-
-        .container {{
-            width: 100%;
-            max-width: 1200px;
-            text-align: center;
-            animation: fadeIn 0.6s ease-out;
-        }}
-
-        @keyframes fadeIn {{
-            from {{
-                opacity: 0;
-                transform: translateY(20px);
-            }}
-            to {{
-                opacity: 1;
-                transform: translateY(0);
-            }}
-        }}
-
-        .logo {{
-            width: 200px;
-            height: 200px;
-            margin: 0 auto 3rem;
-            display: block;
-        }}
-
-        h1 {{
-            font-size: 3rem;
-            font-weight: 800;
-            margin-bottom: 1.5rem;
-            color: #FFFFFF;
-            letter-spacing: 0.05em;
-            text-transform: uppercase;
-        }}
-
-        .subtitle {{
-            font-size: 1rem;
-            font-weight: 500;
-            color: #A0A0A0;
-            line-height: 1.6;
-            margin-bottom: 2rem;
-            letter-spacing: 0.08em;
-            text-transform: uppercase;
-        }}
-
-        .closing-message {{
-            font-size: 0.875rem;
-            font-weight: 500;
-            color: #666666;
-            margin-top: 2rem;
-            letter-spacing: 0.05em;
-        }}
-
-        @media (max-width: 640px) {{
-            .logo {{
-                width: 150px;
-                height: 150px;
-                margin-bottom: 2rem;
-            }}
-
-            h1 {{
-                font-size: 2rem;
-            }}
-
-            .subtitle {{
-                font-size: 0.875rem;
-                margin-bottom: 1.5rem;
-            }}
-
-            .closing-message {{
-                font-size: 0.75rem;
-            }}
-        }}
-    </style>
+    <title>{platform_title} Verification Success - DEiD</title>
+    <link rel="stylesheet" href="/deid-oauth.css">
+    <script src="/deid-oauth-close.js" defer></script>
 </head>
-<body>
+<body data-timeout="5000">
     <div class="container">
         <img src="/deid_logo_noname.png" alt="DEiD Logo" class="logo">
-        <h1>{platform.title()} Verification Success</h1>
+        <h1>{platform_title} Verification Success</h1>
         <p class="subtitle">
-            Your {platform.title()} account has been successfully verified and linked to your DEiD profile.
+            Your {platform_title} account has been successfully verified and linked to your DEiD profile.
         </p>
         <p class="closing-message">
             This window will close automatically in <span id="countdown">5</span> seconds...
         </p>
     </div>
-
-    <script>
-        // Countdown timer
-        let seconds = 5;
-        const countdownElement = document.getElementById('countdown');
-
-        const interval = setInterval(() => {{
-            seconds--;
-            countdownElement.textContent = seconds;
-            if (seconds <= 0) {{
-                clearInterval(interval);
-            }}
-        }}, 1000);
-
-        // Auto-close after 5 seconds
-        setTimeout(() => {{
-            window.close();
-        }}, 5000);
-    </script>
 </body>
 </html>
 """
 
-
-def get_oauth_error_template(
-    platform: str, error_message: str, status_code: Optional[int] = None
-) -> str:
-    """
-    Generate HTML template for OAuth verification error.
-    """
-    return f"""<!DOCTYPE html>
+_ERROR_TPL = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{platform.title()} Verification Failed - DEiD</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800;900&display=swap" rel="stylesheet">
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #000000;
-            min-height: 100vh;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            padding: 2rem;
-            color: #FFFFFF;
-        }}
-
-        .container {{
-            width: 100%;
-            max-width: 1200px;
-            text-align: center;
-            animation: fadeIn 0.6s ease-out;
-        }}
-
-        @keyframes fadeIn {{
-            from {{
-                opacity: 0;
-                transform: translateY(20px);
-            }}
-            to {{
-                opacity: 1;
-                transform: translateY(0);
-            }}
-        }}
-
-        .logo {{
-            width: 200px;
-            height: 200px;
-            margin: 0 auto 3rem;
-            display: block;
-        }}
-
-        h1 {{
-            font-size: 3rem;
-            font-weight: 800;
-            margin-bottom: 1.5rem;
-            color: #FFFFFF;
-            letter-spacing: 0.05em;
-            text-transform: uppercase;
-        }}
-
-        .subtitle {{
-            font-size: 1rem;
-            font-weight: 500;
-            color: #A0A0A0;
-            line-height: 1.6;
-            margin-bottom: 3rem;
-            letter-spacing: 0.08em;
-            text-transform: uppercase;
-        }}
-
-        .return-button {{
-            background: linear-gradient(135deg, #EF4444, #F87171);
-            color: #000000;
-            border: none;
-            border-radius: 3rem;
-            padding: 1.25rem 3rem;
-            font-size: 1.125rem;
-            font-weight: 800;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            text-decoration: none;
-            display: inline-block;
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-            box-shadow: 0 8px 24px rgba(239, 68, 68, 0.4);
-        }}
-
-        .return-button:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 12px 32px rgba(239, 68, 68, 0.5);
-        }}
-
-        .return-button:active {{
-            transform: translateY(0);
-        }}
-
-        @media (max-width: 640px) {{
-            .logo {{
-                width: 150px;
-                height: 150px;
-                margin-bottom: 2rem;
-            }}
-
-            h1 {{
-                font-size: 2rem;
-            }}
-
-            .subtitle {{
-                font-size: 0.875rem;
-                margin-bottom: 2rem;
-            }}
-
-            .return-button {{
-                padding: 1rem 2.5rem;
-                font-size: 1rem;
-            }}
-        }}
-    </style>
+    <title>{platform_title} Verification Failed - DEiD</title>
+    <link rel="stylesheet" href="/deid-oauth.css">
+    <script src="/deid-oauth-close.js" defer></script>
 </head>
-<body>
-    <div class="container">
+<body data-timeout="8000">
+    <div class="container error-page">
         <img src="/deid_logo_noname.png" alt="DEiD Logo" class="logo">
-        <h1>{platform.title()} Verification Failed</h1>
+        <h1>{platform_title} Verification Failed</h1>
         <p class="subtitle">
             {error_message}
         </p>
     </div>
-
-    <script>
-        // Auto-close after 8 seconds
-        setTimeout(() => {{
-            window.close();
-        }}, 8000);
-    </script>
 </body>
 </html>
 """
 
-
-def get_oauth_already_linked_template(
-    platform: str, username: str, account_id: str, status: str
-) -> str:
-    """
-    Generate HTML template for already linked OAuth account.
-    """
-    return f"""<!DOCTYPE html>
+# Fully static: no placeholders, so the page is returned as-is
+_ALREADY_LINKED_PAGE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Account Already Linked - DEiD</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800;900&display=swap" rel="stylesheet">
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #000000;
-            min-height: 100vh;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            padding: 2rem;
-            color: #FFFFFF;
-        }}
-
-        .container {{
-            width: 100%;
-            max-width: 1200px;
-            text-align: center;
-            animation: fadeIn 0.6s ease-out;
-        }}
-
-        @keyframes fadeIn {{
-            from {{
-                opacity: 0;
-                transform: translateY(20px);
-            }}
-            to {{
-                opacity: 1;
-                transform: translateY(0);
-            }}
-        }}
-
-        .logo {{
-            width: 200px;
-            height: 200px;
-            margin: 0 auto 3rem;
-            display: block;
-        }}
-
-        h1 {{
-            font-size: 3rem;
-            font-weight: 800;
-            margin-bottom: 1.5rem;
-            color: #FFFFFF;
-            letter-spacing: 0.05em;
-            text-transform: uppercase;
-        }}
-
-        .subtitle {{
-            font-size: 1rem;
-            font-weight: 500;
-            color: #A0A0A0;
-            line-height: 1.6;
-            margin-bottom: 2rem;
-            letter-spacing: 0.08em;
-            text-transform: uppercase;
-        }}
-
-        .closing-message {{
-            font-size: 0.875rem;
-            font-weight: 500;
-            color: #666666;
-            margin-top: 2rem;
-            letter-spacing: 0.05em;
-        }}
-
-        @media (max-width: 640px) {{
-            .logo {{
-                width: 150px;
-                height: 150px;
-                margin-bottom: 2rem;
-            }}
-
-            h1 {{
-                font-size: 2rem;
-            }}
-
-            .subtitle {{
-                font-size: 0.875rem;
-                margin-bottom: 1.5rem;
-            }}
-
-            .closing-message {{
-                font-size: 0.75rem;
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="/deid-oauth.css">
+    <script src="/deid-oauth-close.js" defer></script>
 </head>
-<body>
+<body data-timeout="5000">
     <div class="container">
         <img src="/deid_logo_noname.png" alt="DEiD Logo" class="logo">
         <h1>Account Already Linked</h1>
@@ -412,169 +80,158 @@ def get_oauth_already_linked_template(
             This window will close automatically in <span id="countdown">5</span> seconds...
         </p>
     </div>
-
-    <script>
-        // Countdown timer
-        let seconds = 5;
-        const countdownElement = document.getElementById('countdown');
-
-        const interval = setInterval(() => {{
-            seconds--;
-            countdownElement.textContent = seconds;
-            if (seconds <= 0) {{
-                clearInterval(interval);
-            }}
-        }}, 1000);
-
-        // Auto-close after 5 seconds
-        setTimeout(() => {{
-            window.close();
-        }}, 5000);
-    </script>
 </body>
 </html>
 """
 
-
-def get_oauth_generic_error_template(error_message: str) -> str:
-    """
-    Generate HTML template for generic OAuth verification error.
-    """
-    return f"""<!DOCTYPE html>
+_GENERIC_ERROR_TPL = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Verification Error - DEiD</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800;900&display=swap" rel="stylesheet">
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #000000;
-            min-height: 100vh;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            padding: 2rem;
-            color: #FFFFFF;
-        }}
-
-        .container {{
-            width: 100%;
-            max-width: 1200px;
-            text-align: center;
-            animation: fadeIn 0.6s ease-out;
-        }}
-
-        @keyframes fadeIn {{
-            from {{
-                opacity: 0;
-                transform: translateY(20px);
-            }}
-            to {{
-                opacity: 1;
-                transform: translateY(0);
-            }}
-        }}
-
-        .logo {{
-            width: 200px;
-            height: 200px;
-            margin: 0 auto 3rem;
-            display: block;
-        }}
-
-        h1 {{
-            font-size: 3rem;
-            font-weight: 800;
-            margin-bottom: 1.5rem;
-            color: #FFFFFF;
-            letter-spacing: 0.05em;
-            text-transform: uppercase;
-        }}
-
-        .subtitle {{
-            font-size: 1rem;
-            font-weight: 500;
-            color: #A0A0A0;
-            line-height: 1.6;
-            margin-bottom: 3rem;
-            letter-spacing: 0.08em;
-            text-transform: uppercase;
-        }}
-
-        .return-button {{
-            background: linear-gradient(135deg, #EF4444, #F87171);
-            color: #000000;
-            border: none;
-            border-radius: 3rem;
-            padding: 1.25rem 3rem;
-            font-size: 1.125rem;
-            font-weight: 800;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            text-decoration: none;
-            display: inline-block;
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-            box-shadow: 0 8px 24px rgba(239, 68, 68, 0.4);
-        }}
-
-        .return-button:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 12px 32px rgba(239, 68, 68, 0.5);
-        }}
-
-        .return-button:active {{
-            transform: translateY(0);
-        }}
-
-        @media (max-width: 640px) {{
-            .logo {{
-                width: 150px;
-                height: 150px;
-                margin-bottom: 2rem;
-            }}
-
-            h1 {{
-                font-size: 2rem;
-            }}
-
-            .subtitle {{
-                font-size: 0.875rem;
-                margin-bottom: 2rem;
-            }}
-
-            .return-button {{
-                padding: 1rem 2.5rem;
-                font-size: 1rem;
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="/deid-oauth.css">
+    <script src="/deid-oauth-close.js" defer></script>
 </head>
-<body>
-    <div class="container">
+<body data-timeout="8000">
+    <div class="container error-page">
         <img src="/deid_logo_noname.png" alt="DEiD Logo" class="logo">
         <h1>Verification Error</h1>
         <p class="subtitle">
             {error_message}
         </p>
     </div>
-
-    <script>
-        // Auto-close after 8 seconds
-        setTimeout(() => {{
-            window.close();
-        }}, 8000);
-    </script>
 </body>
 </html>
 """
+
+
+# The shells above stay indented for readability, but none of that
+# whitespace is significant (no <pre> blocks, no inline scripts), so it is
+# stripped once at import - roughly a quarter of every response body.
+_INTER_TAG_WS_RE = re.compile(r">\s+<")
+_WS_RUN_RE = re.compile(r"\s+")
+
+
+def _minify(page: str) -> str:
+    """Collapse insignificant whitespace in a page shell."""
+    return _WS_RUN_RE.sub(" ", _INTER_TAG_WS_RE.sub("><", page)).strip()
+
+
+_SUCCESS_TPL = _minify(_SUCCESS_TPL)
+_ERROR_TPL = _minify(_ERROR_TPL)
+_ALREADY_LINKED_PAGE = _minify(_ALREADY_LINKED_PAGE)
+_GENERIC_ERROR_TPL = _minify(_GENERIC_ERROR_TPL)
+
+
+# The shells are pre-split on their placeholders once at import (and the
+# static chunks interned, so re-imports and forked workers share one copy),
+# so each render is a single str.join over static chunks and the fields -
+# one allocation of the final size, with no per-call format parsing and no
+# brace escaping in the CSS/JS.
+_SUCCESS_CHUNKS = tuple(
+    sys.intern(chunk) for chunk in _SUCCESS_TPL.split("{platform_title}")
+)
+_ERROR_HEAD, _ERROR_TAIL = _ERROR_TPL.split("{error_message}")
+_ERROR_TAIL = sys.intern(_ERROR_TAIL)
+_ERROR_HEAD_CHUNKS = tuple(
+    sys.intern(chunk) for chunk in _ERROR_HEAD.split("{platform_title}")
+)
+_GENERIC_HEAD, _GENERIC_TAIL = (
+    sys.intern(chunk) for chunk in _GENERIC_ERROR_TPL.split("{error_message}")
+)
+
+# Response bodies go on the wire as UTF-8, so the pages are rendered and
+# encoded in one step; HTMLResponse sends bytes as-is instead of encoding
+# a 3.5 KB str per response.
+_ALREADY_LINKED_PAGE_BYTES = _ALREADY_LINKED_PAGE.encode("utf-8")
+
+
+# The pages are pure functions of the few fields that appear in the HTML,
+# and callbacks repeat them (retries, refreshes, the same handful of
+# platforms), so the rendered pages are memoized. Cache keys deliberately
+# exclude arguments that never reach the page (signature, account ids).
+# Platform names and error messages can carry provider-supplied text, so
+# they are HTML-escaped inside the memoized render - paid once per
+# distinct value, not per response.
+
+
+@lru_cache(maxsize=64)
+def _title(value: str) -> str:
+    """Memoized str.title; platforms repeat from a tiny fixed set."""
+    return value.title()
+
+
+@lru_cache(maxsize=64)
+def _render_success(platform_title: str) -> bytes:
+    """Render (and memoize) the success page for a platform."""
+    chunks = _SUCCESS_CHUNKS
+    platform_title = escape(platform_title)
+    return "".join(
+        (chunks[0], platform_title, chunks[1], platform_title,
+         chunks[2], platform_title, chunks[3])
+    ).encode("utf-8")
+
+
+@lru_cache(maxsize=512)
+def _render_error(platform_title: str, error_message: str) -> bytes:
+    """Render (and memoize) the error page for a platform and message."""
+    chunks = _ERROR_HEAD_CHUNKS
+    platform_title = escape(platform_title)
+    return "".join(
+        (chunks[0], platform_title, chunks[1], platform_title,
+         chunks[2], escape(error_message), _ERROR_TAIL)
+    ).encode("utf-8")
+
+
+@lru_cache(maxsize=512)
+def _render_generic_error(error_message: str) -> bytes:
+    """Render (and memoize) the generic error page for a message."""
+    return "".join(
+        (_GENERIC_HEAD, escape(error_message), _GENERIC_TAIL)
+    ).encode("utf-8")
+
+
+# Callbacks come from the fixed SocialPlatform set, so the success pages for
+# the supported platforms are specialized at import; even the first callback
+# per platform is then a cache hit rather than a render.
+for _platform in ("discord", "twitter", "github", "telegram", "google", "facebook"):
+    _render_success(_title(_platform))
+del _platform
+
+
+def get_oauth_success_template(
+    platform: str, username: str, account_id: str, status: str, signature: str
+) -> bytes:
+    """
+    Generate HTML template for successful OAuth verification.
+
+    Only the platform name appears in the rendered page; the remaining
+    arguments are accepted for caller compatibility.
+    """
+    return _render_success(_title(platform))
+
+
+def get_oauth_error_template(
+    platform: str, error_message: str, status_code: Optional[int] = None
+) -> bytes:
+    """
+    Generate HTML template for OAuth verification error.
+    """
+    return _render_error(_title(platform), error_message)
+
+
+def get_oauth_already_linked_template(
+    platform: str, username: str, account_id: str, status: str
+) -> bytes:
+    """
+    Generate HTML template for already linked OAuth account.
+    """
+    return _ALREADY_LINKED_PAGE_BYTES
+
+
+def get_oauth_generic_error_template(error_message: str) -> bytes:
+    """
+    Generate HTML template for generic OAuth verification error.
+    """
+    return _render_generic_error(error_message)
@@ -0,0 +1,84 @@
+"""
+Micro-batching utility for coalescing concurrent requests.
+
+Several hot paths (validation inserts, balance multicalls) receive bursts
+of near-simultaneous requests that can be served by one bulk operation.
+This module provides the shared queue/deadline/worker machinery so each
+call site only implements how a collected batch is executed.
+"""
+
+import asyncio
+from typing import Any, List, Optional, Tuple
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent submissions into batches executed as one operation.
+
+    Callers submit one payload each and await their own result. The first
+    submission starts a worker that drains the queue for a few milliseconds
+    per batch, then hands the collected (payload, future) pairs to
+    _execute, which subclasses implement to run the bulk operation and
+    resolve each future from its own outcome.
+
+    Every queued future is guaranteed an answer: if _execute raises - or
+    returns leaving futures unresolved - the remaining futures are resolved
+    with failure_result, so submitters never hang on a dead worker.
+    """
+
+    # Value submitters receive when their batch fails
+    failure_result: Any = None
+
+    def __init__(self, max_batch_size: int = 64, max_wait_ms: float = 20.0):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000.0
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, payload: Any) -> Any:
+        """Enqueue one payload and wait for its batch's result."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((payload, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+        return await future
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        """Gather one batch: the first item plus whatever arrives in time."""
+        items = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._max_wait
+        while len(items) < self._max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                items.append(
+                    await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                )
+            except asyncio.TimeoutError:
+                break
+        return items
+
+    async def _drain(self) -> None:
+        """Drain queued payloads in batches until the queue is empty."""
+        while not self._queue.empty():
+            items = await self._collect()
+            try:
+                await self._execute(items)
+            except Exception as e:
+                logger.error(f"{type(self).__name__} batch failed: {e}")
+            finally:
+                # Backstop: whether _execute raised or missed some futures,
+                # every submitter in this batch gets an answer
+                for _, future in items:
+                    if not future.done():
+                        future.set_result(self.failure_result)
+
+    async def _execute(self, items: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Run one batch and resolve each item's future. Subclass hook."""
+        raise NotImplementedError
@@ -4,11 +4,16 @@ Handles environment variables and application settings for decentralized identit
 """
 
 import os
-from typing import Any, Dict, List, Optional
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings
 
+# Comma-separated env values split in one C-level pass (strip included)
+_CSV_RE = re.compile(r"\s*,\s*")
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -25,20 +30,23 @@ class Settings(BaseSettings):
 
     # CORS
     # TODO: Dev Config for Testing
-    ALLOWED_ORIGINS: List[str] = [
+    # Tuples rather than lists: fixed after startup, smaller, and
+    # accidental mutation of shared middleware config raises instead of
+    # silently drifting.
+    ALLOWED_ORIGINS: Tuple[str, ...] = (
         "http://localhost:3000",
         "http://localhost:5173",
         "http://localhost:8080",
         "https://app.de-id.xyz",
         "https://www.de-id.xyz",
         "http://localhost:8000",
-    ]
-    ALLOWED_HOSTS: List[str] = [
+    )
+    ALLOWED_HOSTS: Tuple[str, ...] = (
         "localhost",
         "app.de-id.xyz",
         "api.de-id.xyz",
         "www.de-id.xyz",
-    ]
+    )
 
     # Database - MongoDB
     MONGODB_URL: str = "mongodb://localhost:27017"
@@ -81,10 +89,13 @@ class Settings(BaseSettings):
     BSC_RPC_URL: str = "https://bsc-mainnet.public.blastapi.io"
     BASE_RPC_URL: str = "https://base-mainnet.public.blastapi.io"
 
+    # Resolved once in model_post_init; read on every on-chain call.
+    _active_rpc_url: str = PrivateAttr(default="")
+
     @property
     def ACTIVE_RPC_URL(self) -> str:
         """Get active RPC URL (TESTNET_RPC_URL takes priority over EVM_RPC_URL)."""
-        return self.TESTNET_RPC_URL or self.EVM_RPC_URL
+        return self._active_rpc_url
 
     # IPFS Configuration
     # Pinata credentials (preferred names)
@@ -175,9 +186,15 @@ class Settings(BaseSettings):
     COOKIE_HTTPONLY: bool = True
     COOKIE_PATH: str = "/"
 
-    def get_cookie_domain(self) -> Optional[str]:
+    # Derived values are computed once in model_post_init; the getters below
+    # sit on request hot paths (cookie handling, CORS) and reduce to an
+    # attribute load instead of re-deriving lists and comparisons per call.
+    _cookie_domain: Optional[str] = PrivateAttr(default=None)
+    _effective_cors_origins: Tuple[str, ...] = PrivateAttr(default=())
+
+    def _compute_cookie_domain(self) -> Optional[str]:
         """
-        Get cookie domain based on environment.
+        Compute cookie domain based on environment.
         For cross-origin cookies (localhost -> api.de-id.xyz), domain should be None.
         For same-domain cookies (app.de-id.xyz -> api.de-id.xyz), use ".de-id.xyz".
         """
@@ -197,36 +214,47 @@ class Settings(BaseSettings):
         # For development or cross-origin scenarios, don't set domain
         return None
 
-    def get_effective_cors_origins(self) -> List[str]:
+    def _compute_effective_cors_origins(self) -> Tuple[str, ...]:
         """
-        Get effective CORS origins based on environment.
+        Compute effective CORS origins based on environment.
         Ensures all necessary origins are included for cookie support.
         """
         origins = list(self.ALLOWED_ORIGINS)
+        seen = frozenset(origins)
 
-        # Add common localhost ports if not already present
-        common_ports = [3000, 5173, 8080, 8000]
-        for port in common_ports:
-            origin = f"http://localhost:{port}"
-            if origin not in origins:
-                origins.append(origin)
+        # Add common localhost ports if not already present; the frozenset
+        # makes this a single pass instead of a list scan per port
+        common_ports = (3000, 5173, 8080, 8000)
+        origins.extend(
+            origin
+            for port in common_ports
+            if (origin := f"http://localhost:{port}") not in seen
+        )
 
-        return origins
+        return tuple(origins)
+
+    def get_cookie_domain(self) -> Optional[str]:
+        """Get the cookie domain (precomputed at startup)."""
+        return self._cookie_domain
+
+    def get_effective_cors_origins(self) -> Tuple[str, ...]:
+        """Get effective CORS origins (precomputed at startup)."""
+        return self._effective_cors_origins
 
     @field_validator("ALLOWED_ORIGINS", mode="before")
     @classmethod
     def parse_cors_origins(cls, v):
-        """Parse CORS origins from string or list."""
+        """Parse CORS origins from string or sequence."""
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
+            return tuple(_CSV_RE.split(v.strip()))
         return v
 
     @field_validator("ALLOWED_HOSTS", mode="before")
     @classmethod
     def parse_allowed_hosts(cls, v):
-        """Parse allowed hosts from string or list."""
+        """Parse allowed hosts from string or sequence."""
         if isinstance(v, str):
-            return [host.strip() for host in v.split(",")]
+            return tuple(_CSV_RE.split(v.strip()))
         return v
 
     @field_validator("ENVIRONMENT")
@@ -255,21 +283,43 @@ class Settings(BaseSettings):
         case_sensitive = True
 
     def model_post_init(self, __context: Any) -> None:  # type: ignore[override]
-        """Normalize alternate env var names to pinata fields."""
+        """Normalize alternate env var names and precompute derived values."""
         if not self.IPFS_PINATA_API_KEY and self.IPFS_API_KEY:
             self.IPFS_PINATA_API_KEY = self.IPFS_API_KEY
         if not self.IPFS_PINATA_SECRET and self.IPFS_API_SECRET:
             self.IPFS_PINATA_SECRET = self.IPFS_API_SECRET
 
+        self._active_rpc_url = self.TESTNET_RPC_URL or self.EVM_RPC_URL
+        self._cookie_domain = self._compute_cookie_domain()
+        self._effective_cors_origins = self._compute_effective_cors_origins()
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the process-wide Settings instance.
+
+    Cached so the env-file parsing and pydantic validation pass runs once;
+    repeated calls (tests, FastAPI dependencies) are a dict lookup.
+
+    Returns:
+        Settings: The shared settings instance
+    """
+    return Settings()
+
 
 # Create global settings instance
-settings = Settings()
+settings = get_settings()
 
 
+@lru_cache(maxsize=1)
 def get_mongodb_url() -> str:
     """
     Get MongoDB connection URL with authentication if credentials are provided.
 
+    Cached: settings is a process-wide singleton, so the URL assembly runs
+    once instead of per connection attempt.
+
     Returns:
         str: MongoDB connection URL
     """
@@ -287,6 +337,7 @@ def get_mongodb_url() -> str:
     return settings.MONGODB_URL
 
 
+@lru_cache(maxsize=1)
 def get_mongodb_database_name() -> str:
     """
     Get MongoDB database name.
@@ -301,6 +352,34 @@ def get_mongodb_database_name() -> str:
     return settings.MONGODB_DATABASE
 
 
+def get_missing_integration_settings() -> List[str]:
+    """
+    Return names of integration settings that are not configured.
+
+    Checked once at startup so request handlers don't discover missing
+    credentials mid-flight.
+
+    Returns:
+        List[str]: Names of unset integration settings
+    """
+    checks = {
+        "DISCORD_CLIENT_ID": settings.DISCORD_CLIENT_ID,
+        "DISCORD_CLIENT_SECRET": settings.DISCORD_CLIENT_SECRET,
+        "GITHUB_CLIENT_ID": settings.GITHUB_CLIENT_ID,
+        "GITHUB_CLIENT_SECRET": settings.GITHUB_CLIENT_SECRET,
+        "GOOGLE_CLIENT_ID": settings.GOOGLE_CLIENT_ID,
+        "GOOGLE_CLIENT_SECRET": settings.GOOGLE_CLIENT_SECRET,
+        "FACEBOOK_CLIENT_ID": settings.FACEBOOK_CLIENT_ID,
+        "FACEBOOK_CLIENT_SECRET": settings.FACEBOOK_CLIENT_SECRET,
+        "X_CLIENT_ID": settings.X_CLIENT_ID,
+        "X_CLIENT_SECRET": settings.X_CLIENT_SECRET,
+        "EVM_PRIVATE_KEY": settings.EVM_PRIVATE_KEY,
+        "IPFS_GATEWAY_URL_POST": settings.IPFS_GATEWAY_URL_POST,
+        "PROXY_ADDRESS": settings.PROXY_ADDRESS,
+    }
+    return [name for name, value in checks.items() if not value]
+
+
 def is_production() -> bool:
     """Check if running in production environment."""
     return settings.ENVIRONMENT == "production"
@@ -4,16 +4,136 @@ External service integration for Decode SSO validation.
 This module provides functions to interact with the Decode SSO validation endpoint.
 """
 
-from typing import Any, Dict, Optional
+import asyncio
+import hashlib
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
 import httpx
+import orjson
+from pydantic import TypeAdapter
 
 from app.api.dto.decode_dto import FetchUserDataResponseDTO, SSOValidateResponseDTO
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.infrastructure.http import get_http_client
 
 logger = get_logger(__name__)
 
+# Built once at import so every call reuses the compiled core schema and
+# validates the raw response bytes in a single pydantic-core pass, without
+# the intermediate response.json() dict.
+_SSO_ADAPTER: TypeAdapter[SSOValidateResponseDTO] = TypeAdapter(SSOValidateResponseDTO)
+
+# SSO tokens and profiles are stable within their validity window, yet the
+# same token is often re-validated many times during one session. A short
+# in-process TTL keeps those repeats off the network without letting
+# revocations lag more than a minute.
+_CACHE_TTL_SECONDS = 60.0
+_CACHE_MAX_ENTRIES = 10_000
+
+
+class _ExternalCallCache:
+    """
+    In-process TTL cache with single-flight fetching for external calls.
+
+    Concurrent callers for the same key share one upstream request via a
+    future instead of each hitting the Decode backend. Failed calls
+    (fetchers returning None) are never cached, so errors and rejected
+    tokens are retried on the next call.
+    """
+
+    def __init__(
+        self, maxsize: int = _CACHE_MAX_ENTRIES, ttl: float = _CACHE_TTL_SECONDS
+    ):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+    async def get_or_fetch(
+        self, key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value for key, fetching it at most once."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
+
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Waiters (if any) re-raise from the future; mark the exception
+            # retrieved so lone failures don't log a spurious warning
+            future.exception()
+            raise
+        else:
+            if value is not None:
+                self._store(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def _store(self, key: str, value: Any) -> None:
+        if len(self._entries) >= self._maxsize:
+            now = time.monotonic()
+            expired = [k for k, (dl, _) in self._entries.items() if dl <= now]
+            for k in expired:
+                del self._entries[k]
+            if len(self._entries) >= self._maxsize:
+                # Still full of live entries: drop the one expiring soonest
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+
+    def invalidate(self, key: str) -> None:
+        """Drop a cached value (e.g. after an upstream rejection)."""
+        self._entries.pop(key, None)
+
+
+_external_cache = _ExternalCallCache()
+
+# The Decode backend's responses are small JSON documents; anything past
+# this is malformed or hostile, so the read is cut off instead of
+# buffering an unbounded body into memory.
+_MAX_RESPONSE_BYTES = 64 * 1024
+
+
+async def _read_bounded(
+    response: httpx.Response, limit: int = _MAX_RESPONSE_BYTES
+) -> bytes:
+    """
+    Read a streamed response body, aborting once it exceeds limit bytes.
+
+    Args:
+        response (httpx.Response): A response opened with client.stream().
+        limit (int): Maximum number of body bytes to accept.
+
+    Returns:
+        bytes: The full response body.
+
+    Raises:
+        ValueError: If the body exceeds the limit.
+    """
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if len(body) > limit:
+            raise ValueError(f"Response body exceeded {limit} bytes")
+    return bytes(body)
+
+
+def _token_cache_key(sso_token: str) -> str:
+    """Cache key for a token; hashed so raw tokens never sit in memory."""
+    return "sso:" + hashlib.blake2b(sso_token.encode(), digest_size=16).hexdigest()
+
 
 async def validate_sso_token_external(
     sso_token: str,
@@ -21,6 +141,35 @@ async def validate_sso_token_external(
     """
     Validate SSO token with the external Decode service.
 
+    Results are cached in-process for a short TTL (see _ExternalCallCache),
+    so repeated validations of the same token within a session skip the
+    network round-trip. A token the upstream rejects (success=False) is
+    evicted immediately so a user who re-authenticates isn't served the
+    stale rejection; the reverse case - a token revoked upstream after
+    being cached as valid - is bounded by the TTL, i.e. served for at
+    most another 60 seconds.
+
+    Args:
+        sso_token (str): The SSO token to validate.
+
+    Returns:
+        Optional[SSOValidateResponseDTO]: The response DTO if successful, None otherwise.
+    """
+    cache_key = _token_cache_key(sso_token)
+    response = await _external_cache.get_or_fetch(
+        cache_key, lambda: _validate_sso_token_remote(sso_token)
+    )
+    if response is not None and not response.success:
+        _external_cache.invalidate(cache_key)
+    return response
+
+
+async def _validate_sso_token_remote(
+    sso_token: str,
+) -> Optional[SSOValidateResponseDTO]:
+    """
+    Validate SSO token with the external Decode service.
+
     Args:
         sso_token (str): The SSO token to validate.
 
@@ -36,24 +185,28 @@ async def validate_sso_token_external(
     logger.info(f"Validating SSO token with external service: {sso_validate_url}")
 
     payload = {"sso_token": sso_token}
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(sso_validate_url, json=payload, timeout=10)
+    client = get_http_client()
+    body = b""
+    try:
+        async with client.stream(
+            "POST", sso_validate_url, json=payload, timeout=10
+        ) as response:
+            body = await _read_bounded(response)
             response.raise_for_status()
-            data = response.json()
-            # Parse response into DTO
-            return SSOValidateResponseDTO.parse_obj(data)
-        except httpx.HTTPStatusError as exc:
-            logger.error(
-                f"SSO validation failed with status {exc.response.status_code}: {exc.response.text}"
-            )
-            return None
-        except httpx.ConnectError as exc:
-            logger.error(f"Failed to connect to external service: {exc}")
-            return None
-        except Exception as exc:
-            logger.error(f"Unexpected error during SSO validation: {exc}")
-            return None
+        # Decode and validate the raw bytes in one pydantic-core pass
+        return _SSO_ADAPTER.validate_json(body)
+    except httpx.HTTPStatusError as exc:
+        logger.error(
+            f"SSO validation failed with status {exc.response.status_code}: "
+            f"{body.decode(errors='replace')}"
+        )
+        return None
+    except httpx.ConnectError as exc:
+        logger.error(f"Failed to connect to external service: {exc}")
+        return None
+    except Exception as exc:
+        logger.error(f"Unexpected error during SSO validation: {exc}")
+        return None
 
 
 async def get_decode_profile_external(
@@ -61,25 +214,44 @@ async def get_decode_profile_external(
 ) -> Optional[FetchUserDataResponseDTO]:
     """
     Get Decode profile with the external Decode service.
+
+    Profiles are cached in-process for a short TTL, so bursts of task
+    validations for the same user reuse one fetch.
+    """
+    return await _external_cache.get_or_fetch(
+        f"profile:{user_id}", lambda: _get_decode_profile_remote(user_id)
+    )
+
+
+async def _get_decode_profile_remote(
+    user_id: str,
+) -> Optional[FetchUserDataResponseDTO]:
+    """
+    Get Decode profile with the external Decode service.
     """
     get_decode_profile_url = f"{settings.DECODE_BACKEND_URL}/users/profile/{user_id}"
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(get_decode_profile_url, timeout=10)
+    client = get_http_client()
+    body = b""
+    try:
+        async with client.stream(
+            "GET", get_decode_profile_url, timeout=10
+        ) as response:
+            body = await _read_bounded(response)
             response.raise_for_status()
-            data = response.json()
-            return data
-        except httpx.HTTPStatusError as exc:
-            logger.error(
-                f"Failed to get profile from Decode: {exc.response.status_code}: {exc.response.text}"
-            )
-            return None
-        except httpx.ConnectError as exc:
-            logger.error(f"Failed to connect to external service: {exc}")
-            return None
-        except Exception as exc:
-            logger.error(f"Unexpected error during profile fetch: {exc}")
-            return None
+        # orjson decodes the raw bytes ~3x faster than response.json()
+        return orjson.loads(body)
+    except httpx.HTTPStatusError as exc:
+        logger.error(
+            f"Failed to get profile from Decode: {exc.response.status_code}: "
+            f"{body.decode(errors='replace')}"
+        )
+        return None
+    except httpx.ConnectError as exc:
+        logger.error(f"Failed to connect to external service: {exc}")
+        return None
+    except Exception as exc:
+        logger.error(f"Unexpected error during profile fetch: {exc}")
+        return None
 
 
 async def search_users_external(
@@ -112,22 +284,24 @@ async def search_users_external(
         "Content-Type": "application/json",
     }
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                search_url, params=params, headers=headers, timeout=10
-            )
+    client = get_http_client()
+    body = b""
+    try:
+        async with client.stream(
+            "GET", search_url, params=params, headers=headers, timeout=10
+        ) as response:
+            body = await _read_bounded(response)
             response.raise_for_status()
-            data = response.json()
-            return data
-        except httpx.HTTPStatusError as exc:
-            logger.error(
-                f"User search failed with status {exc.response.status_code}: {exc.response.text}"
-            )
-            return None
-        except httpx.ConnectError as exc:
-            logger.error(f"Failed to connect to external service: {exc}")
-            return None
-        except Exception as exc:
-            logger.error(f"Unexpected error during user search: {exc}")
-            return None
+        return orjson.loads(body)
+    except httpx.HTTPStatusError as exc:
+        logger.error(
+            f"User search failed with status {exc.response.status_code}: "
+            f"{body.decode(errors='replace')}"
+        )
+        return None
+    except httpx.ConnectError as exc:
+        logger.error(f"Failed to connect to external service: {exc}")
+        return None
+    except Exception as exc:
+        logger.error(f"Unexpected error during user search: {exc}")
+        return None
@@ -266,6 +266,68 @@ class TaskNotFoundError(DEIDException):
         super().__init__(message, "TASK_NOT_FOUND", details)
 
 
+# Error-code to HTTP status mapping, built once at import. The error codes
+# stay strings because they are part of the HTTP error payload; as module
+# constants their hashes are computed once, so each lookup is a cached-hash
+# dict hit rather than rebuilding the whole mapping per raised exception.
+_STATUS_MAP: Dict[str, int] = {
+    # Authentication & Authorization
+    "AUTH_ERROR": status.HTTP_401_UNAUTHORIZED,
+    "AUTHZ_ERROR": status.HTTP_403_FORBIDDEN,
+    "SSO_ERROR": status.HTTP_401_UNAUTHORIZED,
+    "SESSION_EXPIRED": status.HTTP_401_UNAUTHORIZED,
+
+    # Identity Management
+    "IDENTITY_NOT_FOUND": status.HTTP_404_NOT_FOUND,
+    "USERNAME_TAKEN": status.HTTP_409_CONFLICT,
+    "INVALID_USERNAME": status.HTTP_400_BAD_REQUEST,
+
+    # Wallet Management
+    "WALLET_ALREADY_LINKED": status.HTTP_409_CONFLICT,
+    "INVALID_WALLET_ADDRESS": status.HTTP_400_BAD_REQUEST,
+    "UNSUPPORTED_CHAIN": status.HTTP_400_BAD_REQUEST,
+    "WALLET_LIMIT_EXCEEDED": status.HTTP_400_BAD_REQUEST,
+
+    # Signature & Verification
+    "SIGNATURE_ERROR": status.HTTP_400_BAD_REQUEST,
+    "INVALID_SIGNATURE": status.HTTP_400_BAD_REQUEST,
+    "NONCE_EXPIRED": status.HTTP_400_BAD_REQUEST,
+
+    # Social Account Verification
+    "SOCIAL_ACCOUNT_LINKED": status.HTTP_409_CONFLICT,
+    "SOCIAL_VERIFICATION_FAILED": status.HTTP_400_BAD_REQUEST,
+    "SOCIAL_ACCOUNT_LIMIT_EXCEEDED": status.HTTP_400_BAD_REQUEST,
+
+    # IPFS & Metadata
+    "IPFS_ERROR": status.HTTP_502_BAD_GATEWAY,
+    "METADATA_TOO_LARGE": status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    "INVALID_METADATA": status.HTTP_400_BAD_REQUEST,
+
+    # Blockchain Operations
+    "BLOCKCHAIN_ERROR": status.HTTP_502_BAD_GATEWAY,
+    "CONTRACT_CALL_FAILED": status.HTTP_502_BAD_GATEWAY,
+    "TRANSACTION_FAILED": status.HTTP_502_BAD_GATEWAY,
+
+    # Database Operations
+    "DATABASE_ERROR": status.HTTP_500_INTERNAL_SERVER_ERROR,
+    "CACHE_ERROR": status.HTTP_500_INTERNAL_SERVER_ERROR,
+
+    # Validation
+    "VALIDATION_ERROR": status.HTTP_422_UNPROCESSABLE_ENTITY,
+
+    # Rate Limiting
+    "RATE_LIMIT_EXCEEDED": status.HTTP_429_TOO_MANY_REQUESTS,
+
+    # Token Management
+    "TOKEN_EXPIRED": status.HTTP_401_UNAUTHORIZED,
+    "INVALID_TOKEN": status.HTTP_401_UNAUTHORIZED,
+
+    # Gamification
+    "ACHIEVEMENT_NOT_FOUND": status.HTTP_404_NOT_FOUND,
+    "TASK_NOT_FOUND": status.HTTP_404_NOT_FOUND,
+}
+
+
 def create_http_exception(
     exc: DEIDException,
     status_code: int = status.HTTP_400_BAD_REQUEST
@@ -300,61 +362,4 @@ def get_exception_status_code(exc: DEIDException) -> int:
     Returns:
         int: HTTP status code
     """
-    status_mapping = {
-        # Authentication & Authorization
-        "AUTH_ERROR": status.HTTP_401_UNAUTHORIZED,
-        "AUTHZ_ERROR": status.HTTP_403_FORBIDDEN,
-        "SSO_ERROR": status.HTTP_401_UNAUTHORIZED,
-        "SESSION_EXPIRED": status.HTTP_401_UNAUTHORIZED,
-
-        # Identity Management
-        "IDENTITY_NOT_FOUND": status.HTTP_404_NOT_FOUND,
-        "USERNAME_TAKEN": status.HTTP_409_CONFLICT,
-        "INVALID_USERNAME": status.HTTP_400_BAD_REQUEST,
-
-        # Wallet Management
-        "WALLET_ALREADY_LINKED": status.HTTP_409_CONFLICT,
-        "INVALID_WALLET_ADDRESS": status.HTTP_400_BAD_REQUEST,
-        "UNSUPPORTED_CHAIN": status.HTTP_400_BAD_REQUEST,
-        "WALLET_LIMIT_EXCEEDED": status.HTTP_400_BAD_REQUEST,
-
-        # Signature & Verification
-        "SIGNATURE_ERROR": status.HTTP_400_BAD_REQUEST,
-        "INVALID_SIGNATURE": status.HTTP_400_BAD_REQUEST,
-        "NONCE_EXPIRED": status.HTTP_400_BAD_REQUEST,
-
-        # Social Account Verification
-        "SOCIAL_ACCOUNT_LINKED": status.HTTP_409_CONFLICT,
-        "SOCIAL_VERIFICATION_FAILED": status.HTTP_400_BAD_REQUEST,
-        "SOCIAL_ACCOUNT_LIMIT_EXCEEDED": status.HTTP_400_BAD_REQUEST,
-
-        # IPFS & Metadata
-        "IPFS_ERROR": status.HTTP_502_BAD_GATEWAY,
-        "METADATA_TOO_LARGE": status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-        "INVALID_METADATA": status.HTTP_400_BAD_REQUEST,
-
-        # Blockchain Operations
-        "BLOCKCHAIN_ERROR": status.HTTP_502_BAD_GATEWAY,
-        "CONTRACT_CALL_FAILED": status.HTTP_502_BAD_GATEWAY,
-        "TRANSACTION_FAILED": status.HTTP_502_BAD_GATEWAY,
-
-        # Database Operations
-        "DATABASE_ERROR": status.HTTP_500_INTERNAL_SERVER_ERROR,
-        "CACHE_ERROR": status.HTTP_500_INTERNAL_SERVER_ERROR,
-
-        # Validation
-        "VALIDATION_ERROR": status.HTTP_422_UNPROCESSABLE_ENTITY,
-
-        # Rate Limiting
-        "RATE_LIMIT_EXCEEDED": status.HTTP_429_TOO_MANY_REQUESTS,
-
-        # Token Management
-        "TOKEN_EXPIRED": status.HTTP_401_UNAUTHORIZED,
-        "INVALID_TOKEN": status.HTTP_401_UNAUTHORIZED,
-
-        # Gamification
-        "ACHIEVEMENT_NOT_FOUND": status.HTTP_404_NOT_FOUND,
-        "TASK_NOT_FOUND": status.HTTP_404_NOT_FOUND,
-    }
-
-    return status_mapping.get(exc.error_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return _STATUS_MAP.get(exc.error_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -10,7 +10,7 @@ from motor.motor_asyncio import (
     AsyncIOMotorCollection,
     AsyncIOMotorDatabase,
 )
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
 from pymongo.errors import DuplicateKeyError
 
 from app.core.config import get_mongodb_database_name, get_mongodb_url
@@ -96,6 +96,13 @@ class SocialLinkRepository:
                 [("platform", ASCENDING)], name="platform_index"
             )
 
+            # Compound index for platform + account_id lookups
+            # (onchain confirmation resolves links without knowing user_id)
+            await self.collection.create_index(
+                [("platform", ASCENDING), ("account_id", ASCENDING)],
+                name="platform_account_index",
+            )
+
             # Index for status queries
             await self.collection.create_index(
                 [("status", ASCENDING)], name="status_index"
@@ -221,6 +228,36 @@ class SocialLinkRepository:
             logger.error(f"Failed to get social link by account: {e}")
             return None
 
+    async def get_social_link_by_platform_account(
+        self, platform: SocialPlatform, account_id: str
+    ) -> Optional[SocialLinkModel]:
+        """
+        Get a social link by platform and account ID (no user_id required).
+
+        Args:
+            platform: Social platform
+            account_id: Social account ID
+
+        Returns:
+            Social link model or None if not found
+        """
+        await self.initialize()
+
+        try:
+            doc = await self.collection.find_one(
+                {"platform": platform.value, "account_id": account_id}
+            )
+
+            if doc:
+                doc["id"] = str(doc["_id"])
+                return SocialLinkModel(**doc)
+
+            return None
+
+        except Exception as e:
+            logger.error(f"Failed to get social link by platform/account: {e}")
+            return None
+
     async def get_user_social_links(
         self, user_id: str, status: Optional[VerificationStatus] = None
     ) -> List[SocialLinkModel]:
@@ -296,6 +333,54 @@ class SocialLinkRepository:
             logger.error(f"Failed to update social link: {e}")
             return None
 
+    async def confirm_onchain(
+        self, user_id: str, platform: SocialPlatform, account_id: str, tx_hash: str
+    ) -> Optional[SocialLinkModel]:
+        """
+        Atomically mark a social link as onchain-verified.
+
+        The account_id is part of the filter so the lookup, mismatch check,
+        and update happen in one round-trip instead of a get followed by an
+        update.
+
+        Args:
+            user_id: User's wallet address or unique identifier
+            platform: Social platform
+            account_id: Social account ID
+            tx_hash: Transaction hash from smart contract
+
+        Returns:
+            Updated social link model, or None if no matching link exists
+        """
+        await self.initialize()
+
+        try:
+            doc = await self.collection.find_one_and_update(
+                {
+                    "user_id": user_id,
+                    "platform": platform.value,
+                    "account_id": account_id,
+                },
+                {
+                    "$set": {
+                        "status": VerificationStatus.ONCHAIN.value,
+                        "tx_hash": tx_hash,
+                        "updated_at": datetime.now(timezone.utc),
+                    }
+                },
+                return_document=ReturnDocument.AFTER,
+            )
+
+            if doc:
+                doc["id"] = str(doc["_id"])
+                return SocialLinkModel(**doc)
+
+            return None
+
+        except Exception as e:
+            logger.error(f"Failed to confirm onchain verification: {e}")
+            return None
+
     async def delete_social_link(self, user_id: str, platform: SocialPlatform) -> bool:
         """
         Delete all social links for a platform.
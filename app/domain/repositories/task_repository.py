@@ -8,6 +8,7 @@ from typing import List, Optional
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument
 
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -15,6 +16,23 @@ from app.domain.models.task import TaskModel, TaskValidationModel
 
 logger = get_logger(__name__)
 
+# Fields the API serializer actually reads; projecting to these keeps BSON
+# decode and wire size bounded as documents grow extra fields (e.g. status).
+# badge_details stays because task responses return it in full.
+_TASK_PROJECTION = {
+    "task_title": 1,
+    "task_description": 1,
+    "validation_type": 1,
+    "blockchain_network": 1,
+    "token_contract_address": 1,
+    "minimum_balance": 1,
+    "badge_details": 1,
+    "tx_hash": 1,
+    "block_number": 1,
+    "created_at": 1,
+    "updated_at": 1,
+}
+
 
 class TaskRepository:
     """Repository for task operations."""
@@ -29,16 +47,52 @@ class TaskRepository:
     async def connect(self):
         """Connect to MongoDB."""
         if not self.client:
-            self.client = AsyncIOMotorClient(settings.MONGO_URI)
+            # One pooled client per process; requests multiplex over its
+            # sockets instead of paying per-request connection setup
+            self.client = AsyncIOMotorClient(
+                settings.MONGO_URI,
+                maxPoolSize=100,
+                minPoolSize=10,
+                waitQueueTimeoutMS=2000,
+            )
             self.db = self.client[settings.MONGO_DB_NAME]
             self.collection = self.db["tasks"]
             self.validations_collection = self.db["task_validations"]
+            await self._create_indexes()
             logger.info("Connected to MongoDB tasks collection")
 
+    async def _create_indexes(self):
+        """Create database indexes for optimal performance."""
+        try:
+            # Compound index covering the pagination filter plus the _id
+            # range cursor, so filtered cursor pages stay an IXSCAN
+            await self.collection.create_index(
+                [
+                    ("validation_type", 1),
+                    ("blockchain_network", 1),
+                    ("_id", 1),
+                ],
+                name="validation_network_id_index",
+            )
+
+            # Validation lookups by (user_id, task_id); non-unique because
+            # repeat validations of the same task are currently allowed
+            await self.validations_collection.create_index(
+                [("user_id", 1), ("task_id", 1)],
+                name="user_task_index",
+            )
+
+            logger.info("Task indexes created successfully")
+
+        except Exception as e:
+            logger.error(f"Failed to create task indexes: {e}")
+            # Don't raise here as the app can still work without indexes
+
     async def disconnect(self):
         """Disconnect from MongoDB."""
         if self.client:
             self.client.close()
+            self.client = None
             logger.info("Disconnected from MongoDB")
 
     async def create_task(self, task_data: TaskModel) -> dict:
@@ -62,15 +116,19 @@ class TaskRepository:
         # Retrieve the created document
         created_task = await self.collection.find_one({"_id": result.inserted_id})
 
-        logger.info(f"Created task with ID: {result.inserted_id}")
+        logger.info("Created task with ID: %s", result.inserted_id)
         return created_task
 
-    async def get_task_by_id(self, task_id: str) -> Optional[dict]:
+    async def get_task_by_id(
+        self, task_id: str, projection: Optional[dict] = _TASK_PROJECTION
+    ) -> Optional[dict]:
         """
         Get task by ID.
 
         Args:
             task_id: Task ID (MongoDB ObjectId as string)
+            projection: Fields to return (defaults to the serializer's fields;
+                pass None for the full document)
 
         Returns:
             Task document or None if not found
@@ -79,7 +137,7 @@ class TaskRepository:
 
         try:
             object_id = ObjectId(task_id)
-            task = await self.collection.find_one({"_id": object_id})
+            task = await self.collection.find_one({"_id": object_id}, projection)
             return task
         except Exception as e:
             logger.error(f"Error getting task by ID {task_id}: {e}")
@@ -91,18 +149,32 @@ class TaskRepository:
         limit: int = 10,
         validation_types: Optional[List[str]] = None,
         blockchain_networks: Optional[List[str]] = None,
-    ) -> tuple[List[dict], int]:
+        after: Optional[str] = None,
+        include_total: bool = False,
+    ) -> tuple[List[dict], Optional[int]]:
         """
         Get paginated list of tasks.
 
+        When an `after` cursor (the _id of the last task from the previous
+        page) is provided, pagination is a range scan on the _id index
+        instead of a skip, which Mongo resolves in O(page size) regardless
+        of how deep the page is. ObjectIds are insertion-ordered, so sorting
+        on _id descending matches the created_at ordering.
+
+        The total count is opt-in: count_documents is O(N) even on an index,
+        so by default one extra document is fetched instead and callers
+        derive has_next from it.
+
         Args:
-            skip: Number of documents to skip
+            skip: Number of documents to skip (ignored when `after` is set)
             limit: Maximum number of documents to return
             validation_types: Optional filter by validation types (list of erc20_balance_check, erc721_balance_check)
             blockchain_networks: Optional filter by blockchain networks (list of ethereum, bsc, base)
+            after: Optional _id cursor from the previous page
+            include_total: Run the count_documents query as well
 
         Returns:
-            Tuple of (list of tasks, total count)
+            Tuple of (list of up to limit+1 tasks, total count or None)
         """
         await self.connect()
 
@@ -113,40 +185,132 @@ class TaskRepository:
         if blockchain_networks and len(blockchain_networks) > 0:
             query["blockchain_network"] = {"$in": blockchain_networks}
 
-        # Get total count
-        total_count = await self.collection.count_documents(query)
-
-        # Get paginated results
-        cursor = (
-            self.collection.find(query).sort("created_at", -1).skip(skip).limit(limit)
+        # Get total count only when requested
+        total_count = (
+            await self.collection.count_documents(query) if include_total else None
         )
-        tasks = await cursor.to_list(length=limit)
+
+        # Get paginated results; fetch one extra row so the caller can tell
+        # whether another page exists without a count query
+        fetch_limit = limit + 1
+        if after:
+            query["_id"] = {"$lt": ObjectId(after)}
+            cursor = (
+                self.collection.find(query, _TASK_PROJECTION)
+                .sort("_id", -1)
+                .limit(fetch_limit)
+            )
+        else:
+            # _id embeds the insertion timestamp, so sorting on it descending
+            # is newest-first while riding the primary-key index
+            cursor = (
+                self.collection.find(query, _TASK_PROJECTION)
+                .sort("_id", -1)
+                .skip(skip)
+                .limit(fetch_limit)
+            )
+        tasks = await cursor.to_list(length=fetch_limit)
 
         logger.info(
-            f"Retrieved {len(tasks)} tasks (skip={skip}, limit={limit}, "
-            f"validation_types={validation_types}, blockchain_networks={blockchain_networks})"
+            "Retrieved %s tasks (skip=%s, limit=%s, after=%s, "
+            "validation_types=%s, blockchain_networks=%s)",
+            len(tasks),
+            skip,
+            limit,
+            after,
+            validation_types,
+            blockchain_networks,
         )
         return tasks, total_count
 
+    async def mark_task_ipfs_failed(self, task_id: str) -> bool:
+        """
+        Mark a task whose badge metadata upload failed.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            True if updated successfully
+        """
+        await self.connect()
+
+        try:
+            result = await self.collection.update_one(
+                {"_id": ObjectId(task_id)},
+                {
+                    "$set": {
+                        "status": "ipfs_failed",
+                        "updated_at": datetime.now(timezone.utc),
+                    }
+                },
+            )
+            return result.modified_count > 0
+        except Exception as e:
+            logger.error(f"Error marking task {task_id} as ipfs_failed: {e}")
+            return False
+
+    async def iter_tasks(
+        self,
+        validation_types: Optional[List[str]] = None,
+        blockchain_networks: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 1000,
+    ):
+        """
+        Iterate tasks newest-first as an async generator.
+
+        Rows stream straight off the Motor cursor instead of being
+        materialized into a list, so large exports hold one batch in
+        memory at a time.
+
+        Args:
+            validation_types: Optional filter by validation types
+            blockchain_networks: Optional filter by blockchain networks
+            after: Optional _id cursor from a previous run
+            limit: Maximum number of documents to yield
+
+        Yields:
+            Task documents
+        """
+        await self.connect()
+
+        query = {}
+        if validation_types and len(validation_types) > 0:
+            query["validation_type"] = {"$in": validation_types}
+        if blockchain_networks and len(blockchain_networks) > 0:
+            query["blockchain_network"] = {"$in": blockchain_networks}
+        if after:
+            query["_id"] = {"$lt": ObjectId(after)}
+
+        cursor = (
+            self.collection.find(query, _TASK_PROJECTION).sort("_id", -1).limit(limit)
+        )
+        async for doc in cursor:
+            yield doc
+
     async def update_task_contract_data(
         self, task_id: str, tx_hash: str, block_number: int
-    ) -> bool:
+    ) -> Optional[dict]:
         """
         Update task with smart contract transaction data.
 
+        Uses find_one_and_update so the merged document comes back in the
+        same round trip instead of requiring a follow-up get.
+
         Args:
             task_id: Task ID
             tx_hash: Transaction hash
             block_number: Block number
 
         Returns:
-            True if updated successfully
+            Updated task document or None if not found
         """
         await self.connect()
 
         try:
             object_id = ObjectId(task_id)
-            result = await self.collection.update_one(
+            updated_task = await self.collection.find_one_and_update(
                 {"_id": object_id},
                 {
                     "$set": {
@@ -155,11 +319,12 @@ class TaskRepository:
                         "updated_at": datetime.now(timezone.utc),
                     }
                 },
+                return_document=ReturnDocument.AFTER,
             )
-            return result.modified_count > 0
+            return updated_task
         except Exception as e:
             logger.error(f"Error updating task {task_id}: {e}")
-            return False
+            return None
 
     async def create_task_validation(
         self, validation_data: TaskValidationModel
@@ -190,6 +355,40 @@ class TaskRepository:
         )
         return created_validation
 
+    async def insert_many_validations(
+        self, validations: List[TaskValidationModel]
+    ) -> int:
+        """
+        Insert several task validation records in one round trip.
+
+        Args:
+            validations: Validation records to insert
+
+        Returns:
+            Number of inserted documents (0 if the insert failed)
+        """
+        await self.connect()
+
+        if not validations:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        docs = []
+        for validation in validations:
+            doc = validation.model_dump()
+            doc["created_at"] = now
+            docs.append(doc)
+
+        try:
+            result = await self.validations_collection.insert_many(
+                docs, ordered=False
+            )
+            logger.info("Inserted %s task validations", len(result.inserted_ids))
+            return len(result.inserted_ids)
+        except Exception as e:
+            logger.error(f"Error bulk inserting task validations: {e}")
+            return 0
+
     async def get_user_task_validation(
         self, user_id: str, task_id: str
     ) -> Optional[dict]:
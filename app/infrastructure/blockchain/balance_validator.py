@@ -3,10 +3,12 @@ Blockchain Balance Validator.
 Validates ERC20 and ERC721 token balances for task validation.
 """
 
-from typing import Optional, Tuple
+import asyncio
+from typing import Dict, List, Optional, Tuple
 
 from web3 import Web3
 
+from app.core.batching import MicroBatcher
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -33,53 +35,182 @@ ERC721_ABI = [
     }
 ]
 
+# Multicall3 is deployed at the same address on Ethereum, BSC and Base, so
+# one constant covers every supported network.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {"name": "requireSuccess", "type": "bool"},
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            },
+        ],
+        "name": "tryAggregate",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+
+# balanceOf(address) has the same selector for ERC20 and ERC721, so both
+# validation types share one calldata builder and one batching queue.
+_BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")
+
+
+def _balance_of_calldata(wallet_checksum: str) -> bytes:
+    """Build balanceOf(address) calldata for a checksummed wallet address."""
+    return _BALANCE_OF_SELECTOR + bytes(12) + bytes.fromhex(wallet_checksum[2:])
+
+
+class _BalanceCallBatcher(MicroBatcher):
+    """
+    Micro-batches balanceOf calls into one Multicall3 round trip per RPC.
+
+    A newly launched badge produces a burst of validations against the same
+    chain; draining the queue for a few milliseconds and issuing a single
+    tryAggregate turns N eth_call round trips into one. Each caller awaits
+    its own future, resolved when its batch returns. The synchronous web3
+    call runs in a worker thread so it never blocks the event loop.
+    """
+
+    def __init__(self, max_batch_size: int = 64, max_wait_ms: float = 20.0):
+        super().__init__(max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+        # One Web3 (and its HTTP session) per RPC endpoint, reused across
+        # batches instead of reconnecting per call
+        self._w3_by_rpc: Dict[str, Web3] = {}
+
+    def _get_w3(self, rpc_url: str) -> Web3:
+        """Get or create the cached Web3 instance for an RPC endpoint."""
+        w3 = self._w3_by_rpc.get(rpc_url)
+        if w3 is None:
+            w3 = Web3(Web3.HTTPProvider(rpc_url))
+            self._w3_by_rpc[rpc_url] = w3
+        return w3
+
+    async def submit_call(
+        self, rpc_url: str, token_checksum: str, wallet_checksum: str
+    ) -> Optional[int]:
+        """
+        Enqueue one balanceOf call and wait for its batch to return.
+
+        Returns:
+            The balance, or None if the call failed on-chain
+        """
+        return await self.submit((rpc_url, token_checksum, wallet_checksum))
+
+    async def _execute(self, items) -> None:
+        """Dispatch one multicall per RPC endpoint in the batch."""
+        # Different networks in the same window are dispatched concurrently
+        groups: Dict[str, List[tuple]] = {}
+        for payload, future in items:
+            groups.setdefault(payload[0], []).append((payload, future))
+        await asyncio.gather(
+            *(
+                self._execute_group(rpc_url, group)
+                for rpc_url, group in groups.items()
+            )
+        )
+
+    async def _execute_group(self, rpc_url: str, items: List[tuple]) -> None:
+        """Run one Multicall3 tryAggregate for all calls against one RPC."""
+        futures = [future for _, future in items]
+        try:
+            w3 = self._get_w3(rpc_url)
+            calls = [
+                (
+                    Web3.to_checksum_address(payload[1]),
+                    _balance_of_calldata(payload[2]),
+                )
+                for payload, _ in items
+            ]
+            multicall = w3.eth.contract(
+                address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI
+            )
+            results = await asyncio.to_thread(
+                multicall.functions.tryAggregate(False, calls).call
+            )
+            for future, (success, return_data) in zip(futures, results):
+                if future.done():
+                    continue
+                if success and len(return_data) >= 32:
+                    future.set_result(int.from_bytes(return_data[:32], "big"))
+                else:
+                    future.set_result(None)
+        except Exception as e:
+            logger.error(f"Multicall balance batch failed on {rpc_url}: {e}")
+            for future in futures:
+                if not future.done():
+                    future.set_result(None)
+
 
 class BlockchainBalanceValidator:
     """Validator for checking token and NFT balances on blockchain."""
 
     def __init__(self):
         """Initialize balance validator."""
-        pass
+        self._batcher = _BalanceCallBatcher()
 
-    async def check_erc20_balance(
+    async def _check_balance_of(
         self,
         wallet_address: str,
-        token_contract_address: str,
+        contract_address: str,
         minimum_balance: int,
         rpc_url: str,
+        kind: str,
     ) -> Tuple[bool, int]:
         """
-        Check if wallet has minimum ERC20 token balance.
+        Check a balanceOf(wallet) result against a minimum via the batcher.
 
         Args:
             wallet_address: User's wallet address
-            token_contract_address: ERC20 token contract address
+            contract_address: Token or NFT contract address
             minimum_balance: Minimum required balance
             rpc_url: Blockchain RPC URL
+            kind: Label for logging (ERC20/ERC721)
 
         Returns:
             Tuple of (is_valid, actual_balance)
         """
         try:
-            # Connect to blockchain
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
-
-            if not w3.is_connected():
-                logger.error(f"Failed to connect to blockchain RPC: {rpc_url}")
-                return False, 0
-
             # Convert addresses to checksum format
             wallet_checksum = Web3.to_checksum_address(wallet_address)
-            token_checksum = Web3.to_checksum_address(token_contract_address)
+            contract_checksum = Web3.to_checksum_address(contract_address)
 
-            # Create contract instance
-            contract = w3.eth.contract(address=token_checksum, abi=ERC20_ABI)
+            # Coalesced with concurrent checks in the same batching window
+            balance = await self._batcher.submit_call(
+                rpc_url, contract_checksum, wallet_checksum
+            )
 
-            # Call balanceOf function
-            balance = contract.functions.balanceOf(wallet_checksum).call()
+            if balance is None:
+                logger.error(
+                    f"{kind} balanceOf call failed: wallet={wallet_address}, "
+                    f"contract={contract_address}"
+                )
+                return False, 0
 
             logger.info(
-                f"ERC20 balance check: wallet={wallet_address}, token={token_contract_address}, balance={balance}, minimum={minimum_balance}"
+                "%s balance check: wallet=%s, contract=%s, balance=%s, minimum=%s",
+                kind,
+                wallet_address,
+                contract_address,
+                balance,
+                minimum_balance,
             )
 
             # Check if balance meets minimum requirement
@@ -88,9 +219,32 @@ class BlockchainBalanceValidator:
             return is_valid, balance
 
         except Exception as e:
-            logger.error(f"Error checking ERC20 balance: {e}", exc_info=True)
+            logger.error(f"Error checking {kind} balance: {e}", exc_info=True)
             return False, 0
 
+    async def check_erc20_balance(
+        self,
+        wallet_address: str,
+        token_contract_address: str,
+        minimum_balance: int,
+        rpc_url: str,
+    ) -> Tuple[bool, int]:
+        """
+        Check if wallet has minimum ERC20 token balance.
+
+        Args:
+            wallet_address: User's wallet address
+            token_contract_address: ERC20 token contract address
+            minimum_balance: Minimum required balance
+            rpc_url: Blockchain RPC URL
+
+        Returns:
+            Tuple of (is_valid, actual_balance)
+        """
+        return await self._check_balance_of(
+            wallet_address, token_contract_address, minimum_balance, rpc_url, "ERC20"
+        )
+
     async def check_erc721_balance(
         self,
         wallet_address: str,
@@ -110,36 +264,9 @@ class BlockchainBalanceValidator:
         Returns:
             Tuple of (is_valid, actual_balance)
         """
-        try:
-            # Connect to blockchain
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
-
-            if not w3.is_connected():
-                logger.error(f"Failed to connect to blockchain RPC: {rpc_url}")
-                return False, 0
-
-            # Convert addresses to checksum format
-            wallet_checksum = Web3.to_checksum_address(wallet_address)
-            nft_checksum = Web3.to_checksum_address(nft_contract_address)
-
-            # Create contract instance
-            contract = w3.eth.contract(address=nft_checksum, abi=ERC721_ABI)
-
-            # Call balanceOf function
-            balance = contract.functions.balanceOf(wallet_checksum).call()
-
-            logger.info(
-                f"ERC721 balance check: wallet={wallet_address}, nft={nft_contract_address}, balance={balance}, minimum={minimum_balance}"
-            )
-
-            # Check if balance meets minimum requirement
-            is_valid = balance >= minimum_balance
-
-            return is_valid, balance
-
-        except Exception as e:
-            logger.error(f"Error checking ERC721 balance: {e}", exc_info=True)
-            return False, 0
+        return await self._check_balance_of(
+            wallet_address, nft_contract_address, minimum_balance, rpc_url, "ERC721"
+        )
 
 
 # Global validator instance
@@ -2,18 +2,61 @@
 Signature utilities for backend validator signing.
 """
 
-from typing import Tuple
+import hashlib
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Tuple
 
 from eth_account import Account
 from eth_account.messages import encode_defunct
+from eth_account.signers.local import LocalAccount
 from web3 import Web3
 
 from app.core.config import settings
 
 
-def sign_message_with_private_key(
+class SignatureResult(NamedTuple):
+    """Result of an EIP-191 signing operation."""
+
+    signature: str  # hex signature with 0x prefix
+    signer: str  # checksummed signer address
+    message_hash: str  # hex keccak hash with 0x prefix
+    signature_bytes: bytes  # raw signature for ABI encoding
+
+
+# Memoized signatures keyed by (message, key fingerprint).
+# ECDSA signing here is deterministic (RFC 6979), so the same message and key
+# always produce the same signature; retries and idempotent callbacks hit the
+# cache instead of redoing keccak + secp256k1 work. Only a hash of the key is
+# stored, never the key itself.
+_SIGNATURE_CACHE_MAX_SIZE = 4096
+_signature_cache: "OrderedDict[Tuple[str, str], SignatureResult]" = OrderedDict()
+
+
+def _key_fingerprint(private_key: str) -> str:
+    """Return a non-reversible fingerprint of a private key for cache keying."""
+    return hashlib.sha256(private_key.encode("utf-8")).hexdigest()
+
+
+# Signer objects cached per key fingerprint. Account.from_key parses the key
+# and derives the public key + checksummed address on every call; that work is
+# invariant per key, so build the LocalAccount once and reuse it for the
+# lifetime of the process (in practice there is one validator key).
+_signer_cache: Dict[str, LocalAccount] = {}
+
+
+def _get_signer(private_key: str) -> LocalAccount:
+    """Return the cached LocalAccount for a private key, building it once."""
+    fingerprint = _key_fingerprint(private_key)
+    signer = _signer_cache.get(fingerprint)
+    if signer is None:
+        signer = Account.from_key(private_key)
+        _signer_cache[fingerprint] = signer
+    return signer
+
+
+def sign_message_detailed(
     message: str, private_key: str = settings.EVM_PRIVATE_KEY
-) -> Tuple[str, str, str]:
+) -> SignatureResult:
     """
     Sign a message matching this ethers.js logic:
 
@@ -25,9 +68,17 @@ def sign_message_with_private_key(
     - Compute messageHash = keccak256(utf8(message))
     - Sign the messageHash bytes using personal_sign (EIP-191)
 
-    Returns (signature_hex, signer_address, message_hash_hex)
+    Returns a SignatureResult carrying both the hex signature (for JSON
+    responses) and the raw signature bytes (for ABI encoding), so callers
+    don't re-decode the hex on the calldata path.
     """
 
+    cache_key = (message, _key_fingerprint(private_key))
+    cached = _signature_cache.get(cache_key)
+    if cached is not None:
+        _signature_cache.move_to_end(cache_key)
+        return cached
+
     # Step 1: Compute message hash (ethers.keccak256(ethers.toUtf8Bytes(message)))
     message_bytes = message.encode("utf-8")
     message_hash_bytes = Web3.keccak(message_bytes)  # 32-byte hash as bytes
@@ -39,15 +90,37 @@ def sign_message_with_private_key(
     # Step 3: EIP-191 personal_sign using encode_defunct
     eth_message = encode_defunct(message_hash_bytes)
 
-    # Step 4: Sign with eth_account
-    signed = Account.sign_message(eth_message, private_key=private_key)
+    # Step 4: Sign with the cached signer (key parse + address derivation
+    # happen once per key, not per call)
+    signer = _get_signer(private_key)
+    signed = signer.sign_message(eth_message)
+    signer_address = signer.address
 
-    # Get the signer address from the private key
-    signer_address = Account.from_key(private_key).address
+    signature_raw = bytes(signed.signature)
 
-    signature_hex = signed.signature.hex()
+    result = SignatureResult(
+        signature=signed.signature.hex(),
+        signer=signer_address,
+        message_hash=message_hash_hex,
+        signature_bytes=signature_raw,
+    )
+    _signature_cache[cache_key] = result
+    if len(_signature_cache) > _SIGNATURE_CACHE_MAX_SIZE:
+        _signature_cache.popitem(last=False)
 
-    return (signature_hex, signer_address, message_hash_hex)
+    return result
+
+
+def sign_message_with_private_key(
+    message: str, private_key: str = settings.EVM_PRIVATE_KEY
+) -> Tuple[str, str, str]:
+    """
+    Compatibility wrapper around sign_message_detailed.
+
+    Returns (signature_hex, signer_address, message_hash_hex)
+    """
+    result = sign_message_detailed(message, private_key)
+    return (result.signature, result.signer, result.message_hash)
 
 
 def sign_user_task_message(
@@ -91,11 +164,10 @@ def sign_user_task_message(
     # This is equivalent to getEthSignedMessageHash(messageHash) in Solidity
     eth_message = encode_defunct(message_hash)
 
-    # Step 3: Sign the EIP-191 message hash
-    signed = Account.sign_message(eth_message, private_key=private_key)
-
-    # Get the signer address from the private key
-    signer_address = Account.from_key(private_key).address
+    # Step 3: Sign the EIP-191 message hash with the cached signer
+    signer = _get_signer(private_key)
+    signed = signer.sign_message(eth_message)
+    signer_address = signer.address
 
     signature_hex = signed.signature.hex()
 
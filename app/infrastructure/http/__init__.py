@@ -0,0 +1,12 @@
+"""
+HTTP infrastructure module.
+Provides a shared pooled httpx client for outbound requests.
+"""
+
+from .http_client import close_http_client, get_http_client, warm_http_client
+
+__all__ = [
+    "get_http_client",
+    "close_http_client",
+    "warm_http_client",
+]
@@ -0,0 +1,65 @@
+"""
+Shared HTTP client for outbound requests.
+Provides a single pooled httpx.AsyncClient so services reuse keep-alive
+connections instead of paying a TCP+TLS handshake per call.
+"""
+
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Module-level shared client (created lazily, closed on app shutdown)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared pooled HTTP client, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient: Shared client with connection pooling enabled
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(10.0),
+        )
+        logger.info("Shared HTTP client initialized")
+    return _http_client
+
+
+async def warm_http_client() -> None:
+    """
+    Prime DNS resolution and TLS handshakes for hot external hosts so the
+    first real request doesn't pay them. Best effort; failures are ignored.
+    """
+    client = get_http_client()
+    warmup_urls = (
+        "https://oauth2.googleapis.com/",
+        settings.IPFS_GATEWAY_URL_POST,
+    )
+    for url in warmup_urls:
+        try:
+            await client.head(url, timeout=2.0)
+        except Exception:
+            pass  # Warm-up only; the real request will surface errors
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client. Called on application shutdown."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+        logger.info("Shared HTTP client closed")
+    _http_client = None
@@ -3,13 +3,13 @@ IPFS Service for uploading badge metadata.
 Handles uploading JSON metadata to IPFS gateway.
 """
 
-import json
 from typing import Dict, Optional
 
-import httpx
+import orjson
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.infrastructure.http import get_http_client
 
 logger = get_logger(__name__)
 
@@ -33,33 +33,34 @@ class IPFSService:
             IPFS hash (CID) or None if failed
         """
         try:
-            # Convert badge data to JSON string
-            json_data = json.dumps(badge_data, indent=2)
+            # Serialize once with orjson; it emits UTF-8 bytes directly,
+            # which matters for large badge attribute arrays
+            json_bytes = orjson.dumps(badge_data)
 
             # Prepare multipart form data
             files = {
                 "file": (
                     "metadata.json",
-                    json_data.encode("utf-8"),
+                    json_bytes,
                     "application/json",
                 )
             }
 
             logger.info(f"Uploading to IPFS: {self.ipfs_add_url}")
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(self.ipfs_add_url, files=files)
-
-                if response.status_code == 200:
-                    result = response.json()
-                    ipfs_hash = result.get("Hash")
-                    logger.info(f"Uploaded to IPFS: {ipfs_hash}")
-                    return ipfs_hash
-                else:
-                    logger.error(
-                        f"Failed to upload to IPFS: {response.status_code} - {response.text}"
-                    )
-                    return None
+            client = get_http_client()
+            response = await client.post(self.ipfs_add_url, files=files, timeout=30.0)
+
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                ipfs_hash = result.get("Hash")
+                logger.info(f"Uploaded to IPFS: {ipfs_hash}")
+                return ipfs_hash
+            else:
+                logger.error(
+                    f"Failed to upload to IPFS: {response.status_code} - {response.text}"
+                )
+                return None
 
         except Exception as e:
             logger.error(f"Error uploading to IPFS: {e}", exc_info=True)
@@ -4,15 +4,18 @@ Main entry point for the DEID (Decentralized Identity) backend service.
 Handles decentralized identity management, cross-chain wallet linking, and SSO integration.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from app.core.config import settings
+from app.core.config import get_missing_integration_settings, settings
 from app.core.logging import get_logger, setup_logging
+from app.infrastructure.http import close_http_client, warm_http_client
 
 logger = get_logger(__name__)
 
@@ -25,11 +28,22 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     setup_logging()
+    # Validate integration settings once here instead of per-request
+    missing_settings = get_missing_integration_settings()
+    if missing_settings:
+        logger.warning(
+            f"Integration settings not configured: {', '.join(missing_settings)}"
+        )
+    # Warm the outbound connection pool without blocking startup
+    asyncio.create_task(warm_http_client())
     # TODO: Initialize MongoDB when database layer is ready
     # await init_mongodb()
     yield
     # Shutdown
-    # Add any cleanup logic here if needed
+    from app.domain.repositories.task_repository import task_repository
+
+    await task_repository.disconnect()
+    await close_http_client()
 
 
 def create_app() -> FastAPI:
@@ -63,6 +77,11 @@ def create_app() -> FastAPI:
         expose_headers=["*"],
     )
 
+    # Compress response bodies for clients that accept it; the OAuth HTML
+    # pages and task list JSON are mostly repetitive text that shrinks ~5-7x.
+    # Small bodies are left alone to avoid wasted compress cycles.
+    app.add_middleware(GZipMiddleware, minimum_size=500)
+
     # Trusted host middleware
     # Note: This only validates the Host header, not the Origin header
     # CORS middleware handles Origin validation separately
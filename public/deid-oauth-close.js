@@ -0,0 +1,22 @@
+// Auto-close behavior for the DEiD OAuth callback pages.
+// The close delay comes from <body data-timeout="...">; pages with a
+// #countdown element also tick it down once per second.
+(function () {
+    const timeout = parseInt(document.body.dataset.timeout || '5000', 10);
+    const countdownElement = document.getElementById('countdown');
+
+    if (countdownElement) {
+        let seconds = Math.round(timeout / 1000);
+        const interval = setInterval(() => {
+            seconds--;
+            countdownElement.textContent = seconds;
+            if (seconds <= 0) {
+                clearInterval(interval);
+            }
+        }, 1000);
+    }
+
+    setTimeout(() => {
+        window.close();
+    }, timeout);
+})();
@@ -1,11 +1,37 @@
+import json
+
 import pytest
 
 from app.api.dto.task_dto import TaskValidationDataDTO, TaskValidationResponseDTO
 from app.api.services.task_service import task_service
+from app.infrastructure.cache import cache_service
 
 pytestmark = pytest.mark.anyio("asyncio")
 
 
+def _badge_details() -> dict:
+    return {
+        "badge_name": "Token Holder",
+        "badge_description": "Holds the minimum token balance",
+        "badge_image": "QmBadgeImageHash",
+        "attributes": [{"trait_type": "tier", "value": "bronze"}],
+    }
+
+
+def _serialized_task(task_id: str) -> dict:
+    """A task as the service returns it from get_tasks_paginated."""
+    return {
+        "id": task_id,
+        "task_title": "Hold tokens",
+        "task_description": "Hold the minimum token balance",
+        "validation_type": "erc20_balance_check",
+        "blockchain_network": "ethereum",
+        "token_contract_address": "0x1111111111111111111111111111111111111111",
+        "minimum_balance": 10,
+        "badge_details": _badge_details(),
+    }
+
+
 @pytest.mark.anyio
 async def test_task_validation_endpoint_returns_signature(async_client, monkeypatch):
     """Ensure /task/{id}/validate delegates to the task service and returns its DTO."""
@@ -38,3 +64,136 @@ async def test_task_validation_endpoint_returns_signature(async_client, monkeypa
     body = response.json()
     assert body["success"] is True
     assert body["data"]["signature"] == sample_signature
+
+
+@pytest.mark.anyio
+async def test_task_list_omits_totals_by_default(async_client, monkeypatch):
+    """By default /task/list returns has_next/next_cursor but no totals."""
+
+    cursor_id = "64" + "0" * 22
+
+    async def fake_get_tasks_paginated(**kwargs):
+        assert kwargs["include_total"] is False
+        return [_serialized_task(cursor_id)], 0, 0, cursor_id, True
+
+    monkeypatch.setattr(task_service, "get_tasks_paginated", fake_get_tasks_paginated)
+
+    response = await async_client.get("/api/v1/task/list")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert len(body["data"]) == 1
+    pagination = body["pagination"]
+    assert pagination["has_next"] is True
+    assert pagination["next_cursor"] == cursor_id
+    assert "total_count" not in pagination
+    assert "total_pages" not in pagination
+
+
+@pytest.mark.anyio
+async def test_task_list_includes_totals_when_requested(async_client, monkeypatch):
+    """include_total=true adds total_count/total_pages to the pagination block."""
+
+    async def fake_get_tasks_paginated(**kwargs):
+        assert kwargs["include_total"] is True
+        return [_serialized_task("64" + "0" * 22)], 42, 5, None, False
+
+    monkeypatch.setattr(task_service, "get_tasks_paginated", fake_get_tasks_paginated)
+
+    response = await async_client.get("/api/v1/task/list?include_total=true")
+    assert response.status_code == 200
+    pagination = response.json()["pagination"]
+    assert pagination["total_count"] == 42
+    assert pagination["total_pages"] == 5
+    assert pagination["has_next"] is False
+    assert pagination["next_cursor"] is None
+
+
+@pytest.mark.anyio
+async def test_task_list_rejects_malformed_cursor(async_client):
+    """A non-ObjectId 'after' cursor yields an error DTO, not a 500."""
+
+    response = await async_client.get("/api/v1/task/list?after=not-an-object-id")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is False
+    assert "cursor" in body["message"]
+
+
+@pytest.mark.anyio
+async def test_task_stream_rejects_malformed_cursor(async_client):
+    """/task/list/stream validates the cursor before streaming starts."""
+
+    response = await async_client.get(
+        "/api/v1/task/list/stream?after=not-an-object-id"
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_task_stream_emits_ndjson_with_mapped_filters(async_client, monkeypatch):
+    """The stream endpoint maps filters and emits one JSON task per line."""
+
+    seen = {}
+
+    async def fake_stream_tasks(*, validation_types, blockchain_networks, after, limit):
+        seen["validation_types"] = validation_types
+        seen["blockchain_networks"] = blockchain_networks
+        for task_id in ("task-1", "task-2"):
+            yield _serialized_task(task_id)
+
+    monkeypatch.setattr(task_service, "stream_tasks", fake_stream_tasks)
+
+    response = await async_client.get(
+        "/api/v1/task/list/stream?type=token&network=ethereum"
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.content.splitlines() if line]
+    assert [row["id"] for row in rows] == ["task-1", "task-2"]
+    assert seen["validation_types"] == ["erc20_balance_check"]
+    assert seen["blockchain_networks"] == ["ethereum"]
+
+
+@pytest.mark.anyio
+async def test_cached_validation_short_circuits_revalidation(async_client, monkeypatch):
+    """A validation cached in Redis is served without re-checking chain state."""
+
+    task_oid = "64" + "1" * 22
+    wallet = "0x000000000000000000000000000000000000dEaD"
+    cached_validation = {
+        "actual_balance": "250",
+        "signature": "0xcachedsig",
+        "verification_hash": "cached-hash",
+    }
+
+    async def fake_get_profile(user_id: str):
+        return {"success": True, "data": {"primary_wallet": {"address": wallet}}}
+
+    async def fake_get_task(task_id: str):
+        assert task_id == task_oid
+        task = _serialized_task(task_oid)
+        task["_id"] = task.pop("id")
+        return task
+
+    async def fake_cache_get(key: str):
+        return cached_validation
+
+    monkeypatch.setattr(
+        "app.api.services.task_service.get_decode_profile_external", fake_get_profile
+    )
+    monkeypatch.setattr(task_service, "_get_task_cached", fake_get_task)
+    monkeypatch.setattr(cache_service, "get", fake_cache_get)
+
+    response = await async_client.post(f"/api/v1/task/{task_oid}/validate")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert body["message"] == "Task already validated for this user"
+    data = body["data"]
+    assert data["user_wallet"] == wallet
+    assert data["actual_balance"] == "250"
+    assert data["required_balance"] == "10"
+    assert data["signature"] == "0xcachedsig"
+    assert data["verification_hash"] == "cached-hash"
+    assert data["task_details"]["id"] == task_oid